@@ -21,7 +21,7 @@ except ImportError:
     supervisor = None
 
 try:
-    from typing import Sequence
+    from typing import Optional, Sequence
 except ImportError:
     pass
 
@@ -35,52 +35,134 @@ __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_HID.git"
 
 
+# Last sequence searched for each (usage_page, usage), and the index of the device found
+# in it. Only one entry per usage: searching new sequences does not make it grow.
+_device_indices = {}
+
+# Set once USB has been found ready, so later waits return immediately.
+_usb_ready = False  # pylint: disable=invalid-name
+
+
+def wait_for_usb(timeout: float = None, poll_interval: float = 0.01) -> None:
+    """
+    Wait for USB to be connected to the host.
+
+    Once USB is ready, later calls return immediately, so several devices created in a row
+    (for instance by `find_device` for each ``Keyboard``, ``Mouse`` and ``ConsumerControl``)
+    share a single wait.
+
+    Blinka cannot tell whether USB is ready: the first wait lasting a full second is
+    assumed to be enough, and shorter waits only sleep for ``timeout`` seconds.
+
+    :param timeout: Time in seconds to wait for USB to become ready before timing out.
+      Defaults to None to wait indefinitely. Use 0 to check once without waiting.
+    :param poll_interval: Time in seconds between two checks. Defaults to 0.01.
+    :raises OSError: if USB is not ready after ``timeout`` seconds.
+    """
+    global _usb_ready  # pylint: disable=global-statement
+    if _usb_ready:
+        return
+    if supervisor is None:
+        # Blinka doesn't have supervisor (see issue Adafruit_Blinka#711), so wait
+        # one second for USB to become ready, the first time only
+        delay = 1.0 if timeout is None else min(timeout, 1.0)
+        time.sleep(delay)
+        if delay == 1.0:
+            _usb_ready = True
+        return
+    start = time.monotonic()
+    while not supervisor.runtime.usb_connected:
+        if timeout is not None and time.monotonic() - start >= timeout:
+            raise OSError("Failed to initialize HID device. Is USB connected?")
+        time.sleep(poll_interval)
+    _usb_ready = True
+
+
+def _match_device(devices: Sequence[object], usage_page: int, usage: int) -> object:
+    """Return the device with the matching usage_page and usage, without waiting for USB.
+
+    :raises ValueError: if there is no matching device.
+    """
+    device = None
+    if hasattr(devices, "send_report"):
+        key = None
+        devices = [devices]  # type: ignore
+    else:
+        key = (usage_page, usage)
+        cached = _device_indices.get(key)
+        if cached is not None and cached[0] is devices and cached[1] < len(devices):
+            dev = devices[cached[1]]
+            if dev.usage_page == usage_page and dev.usage == usage:
+                device = dev
+    if device is None:
+        for index, dev in enumerate(devices):
+            if (
+                dev.usage_page == usage_page
+                and dev.usage == usage
+                and hasattr(dev, "send_report")
+            ):
+                device = dev
+                if key is not None:
+                    _device_indices[key] = (devices, index)
+                break
+    if device is None:
+        raise ValueError("Could not find matching HID device.")
+    return device
+
+
+class _DeviceWrapper:
+    """Base class of the devices wrapping another HID device, like `CoalescingDevice`.
+
+    A wrapper has the ``usage_page`` and ``usage`` of the wrapped device and forwards
+    output reports from it, so it can be passed anywhere a device is expected, for
+    instance to `find_device`, ``Keyboard``, ``Mouse``, ``ConsumerControl`` or ``Gamepad``,
+    unless the wrapper refuses the device. Subclasses implement ``send_report()``.
+    """
+
+    def __init__(self, device: object) -> None:
+        """:param device: The device to wrap: any object that implements ``send_report()``,
+        ``usage_page`` and ``usage``, such as one returned by `find_device`."""
+        self._device = device
+        self.usage_page = device.usage_page
+        self.usage = device.usage
+
+    def __str__(self):
+        return str(self._device)
+
+    def get_last_received_report(
+        self, report_id: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Return the last report received by the wrapped device, or None."""
+        if report_id is None:
+            return self._device.get_last_received_report()
+        return self._device.get_last_received_report(report_id)
+
+
 def find_device(
     devices: Sequence[object],
     *,
     usage_page: int,
     usage: int,
-    timeout: int = None,
+    timeout: float = None,
 ) -> object:
     """
     Search through the provided sequence of devices to find the one with the matching
     usage_page and usage.
 
+    The position of the device found is remembered, so searching the same sequence again
+    for the same usage_page and usage does not scan it.
+
     :param timeout: Time in seconds to wait for USB to become ready before timing out.
-      Defaults to None to wait indefinitely.
+      Defaults to None to wait indefinitely. Use 0 to check once without waiting.
       Ignored if device is not a `usb_hid.Device`; it might be BLE, for instance.
+      See `wait_for_usb`.
+    :raises OSError: if USB is not ready after ``timeout`` seconds.
     """
 
-    if hasattr(devices, "send_report"):
-        devices = [devices]  # type: ignore
-    device = None
-    for dev in devices:
-        if (
-            dev.usage_page == usage_page
-            and dev.usage == usage
-            and hasattr(dev, "send_report")
-        ):
-            device = dev
-            break
-    if device is None:
-        raise ValueError("Could not find matching HID device.")
+    device = _match_device(devices, usage_page, usage)
 
     # Wait for USB to be connected only if this is a usb_hid.Device.
     if Device and isinstance(device, Device):
-        if supervisor is None:
-            # Blinka doesn't have supervisor (see issue Adafruit_Blinka#711), so wait
-            # one second for USB to become ready
-            time.sleep(1.0)
-        elif timeout is None:
-            # default behavior: wait indefinitely for USB to become ready
-            while not supervisor.runtime.usb_connected:
-                time.sleep(1.0)
-        else:
-            # wait up to timeout seconds for USB to become ready
-            for _ in range(timeout):
-                if supervisor.runtime.usb_connected:
-                    return device
-                time.sleep(1.0)
-            raise OSError("Failed to initialize HID device. Is USB connected?")
+        wait_for_usb(timeout)
 
     return device
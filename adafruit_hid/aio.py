@@ -0,0 +1,374 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.aio`
+====================================================
+
+Awaitable counterparts of `Keyboard`, `Mouse`, `ConsumerControl`, `Gamepad` and
+keyboard layouts, so one ``asyncio`` event loop can drive several devices at once.
+
+Each async class builds its reports with the matching synchronous class, then sends them
+to the device. If the device ``send_report()`` returns an awaitable, it is awaited, so
+devices may implement ``send_report()`` either as a plain method or as a coroutine.
+
+Unlike their synchronous counterparts, the async classes do not wait for USB to become
+ready when created: ``await`` `wait_for_usb` first if needed.
+
+* Author(s): quaxalber
+"""
+
+import time
+
+import asyncio
+
+import adafruit_hid
+from . import _DeviceWrapper, _match_device
+from .consumer_control import ConsumerControl
+from .gamepad import Gamepad
+from .keyboard import Keyboard
+from .keyboard_layout_base import KeyboardLayoutBase
+from .keyboard_layout_us import KeyboardLayoutUS
+from .mouse import Mouse
+
+try:
+    from typing import Optional, Sequence
+except ImportError:
+    pass
+
+# pylint: disable=protected-access
+
+
+async def wait_for_usb(timeout: float = None, poll_interval: float = 0.01) -> None:
+    """Wait for USB to be connected to the host, without blocking the event loop.
+    See `adafruit_hid.wait_for_usb`.
+
+    :param timeout: Time in seconds to wait for USB to become ready before timing out.
+      Defaults to None to wait indefinitely.
+    :param poll_interval: Time in seconds between two checks. Defaults to 0.01.
+    :raises OSError: if USB is not ready after ``timeout`` seconds.
+    """
+    if adafruit_hid.supervisor is None:
+        # Blinka: give USB one second to become ready, the first time only.
+        if not adafruit_hid._usb_ready:
+            delay = 1.0 if timeout is None else min(timeout, 1.0)
+            await asyncio.sleep(delay)
+            if delay == 1.0:
+                adafruit_hid._usb_ready = True
+        return
+    start = time.monotonic()
+    while True:
+        try:
+            adafruit_hid.wait_for_usb(0)
+            return
+        except OSError:
+            if timeout is not None and time.monotonic() - start >= timeout:
+                raise
+        await asyncio.sleep(poll_interval)
+
+
+class _ReportRelay(_DeviceWrapper):
+    """Stand-in device given to a synchronous HID object: keeps the reports it sends,
+    to be sent to the real device by `_flush`."""
+
+    def __init__(self, device: object) -> None:
+        super().__init__(device)
+        self._reports = []
+
+    def send_report(self, report: bytes, report_id: Optional[int] = None) -> None:
+        """Keep a copy of the report, to be sent by `_flush`."""
+        self._reports.append((bytes(report), report_id))
+
+    async def _flush(self) -> None:
+        """Send the reports kept so far, in order, awaiting the device if needed."""
+        reports = self._reports
+        device = self._device
+        while reports:
+            report, report_id = reports.pop(0)
+            if report_id is None:
+                result = device.send_report(report)
+            else:
+                result = device.send_report(report, report_id)
+            if result is not None:
+                await result
+
+
+class AsyncKeyboard(_ReportRelay):
+    """Send HID keyboard reports, awaiting each send. See `Keyboard`."""
+
+    def __init__(self, devices: Sequence[object], **kwargs) -> None:
+        """Create an AsyncKeyboard object that will send keyboard HID reports.
+
+        :param devices: A sequence of devices that includes a keyboard device,
+          or a keyboard device itself.
+        :param kwargs: Other arguments given to `Keyboard`, like ``overflow``.
+        """
+        super().__init__(_match_device(devices, 0x1, 0x06))
+        self.keyboard = Keyboard(self, **kwargs)
+        """The `Keyboard` building the reports."""
+
+    async def press(self, *keycodes: int) -> None:
+        """Press the given keycodes. See `Keyboard.press`."""
+        self.keyboard.press(*keycodes)
+        await self._flush()
+
+    async def release(self, *keycodes: int) -> None:
+        """Release the given keycodes. See `Keyboard.release`."""
+        self.keyboard.release(*keycodes)
+        await self._flush()
+
+    async def release_all(self) -> None:
+        """Release all pressed keys."""
+        self.keyboard.release_all()
+        await self._flush()
+
+    async def send(self, *keycodes: int) -> None:
+        """Press the given keycodes and then release all pressed keys."""
+        self.keyboard.press(*keycodes)
+        self.keyboard.release_all()
+        await self._flush()
+
+    async def send_reports(self, reports: bytes) -> None:
+        """Send ready-made keyboard reports. See `Keyboard.send_reports`."""
+        self.keyboard.send_reports(reports)
+        await self._flush()
+
+    @property
+    def led_status(self) -> bytes:
+        """Returns the last received report"""
+        return self.keyboard.led_status
+
+    def led_on(self, led_code: int) -> bool:
+        """Returns whether an LED is on based on the led code"""
+        return self.keyboard.led_on(led_code)
+
+
+class AsyncKeyboardLayout:
+    """Type strings on an `AsyncKeyboard`, awaiting each send and each delay.
+    See `KeyboardLayoutBase`."""
+
+    def __init__(
+        self,
+        keyboard: AsyncKeyboard,
+        layout_class: type = KeyboardLayoutUS,
+        typing_mode: int = KeyboardLayoutBase.TYPING_SEQUENTIAL,
+    ) -> None:
+        """Specify the keyboard and layout to type strings with.
+
+        :param keyboard: an AsyncKeyboard object.
+        :param layout_class: a `KeyboardLayoutBase` subclass. Defaults to `KeyboardLayoutUS`.
+        :param typing_mode: How characters are turned into reports.
+          See `KeyboardLayoutBase.typing_mode`.
+
+        Example::
+
+            kbd = AsyncKeyboard(usb_hid.devices)
+            layout = AsyncKeyboardLayout(kbd)
+            await layout.write('abc\\n', delay=0.05)
+        """
+        self.keyboard = keyboard
+        self.layout = layout_class(keyboard.keyboard, typing_mode)
+        """The `KeyboardLayoutBase` building the reports."""
+
+    async def write(self, string: str, delay: float = None) -> None:
+        """Type the string, letting other tasks run between characters.
+        See `KeyboardLayoutBase.write`.
+
+        :param string: A string of UTF-8 characters to convert to key presses and send.
+        :param float delay: Optional delay in seconds between key presses.
+        :raises ValueError: if any of the characters has no keycode.
+        """
+        layout = self.layout
+        emit = layout.keyboard.send_reports
+        layout._hold_modifiers()
+        try:
+            for char in string:
+                layout._type_char(char, emit)
+                if delay is not None:
+                    layout._release_keystroke(emit)
+                await self.keyboard._flush()
+                await asyncio.sleep(0 if delay is None else delay)
+        finally:
+            layout._release_keystroke(emit)
+            await self.keyboard._flush()
+
+    async def write_compiled(self, reports: bytes, delay: float = None) -> None:
+        """Send keyboard reports returned by `KeyboardLayoutBase.compile`.
+
+        :param reports: A buffer of 8-byte keyboard reports.
+        :param float delay: Optional delay in seconds after each report.
+        """
+        if delay is None:
+            await self.keyboard.send_reports(reports)
+            return
+        view = memoryview(reports)
+        for start in range(0, len(view), 8):
+            await self.keyboard.send_reports(view[start : start + 8])
+            await asyncio.sleep(delay)
+
+    def compile(self, string: str) -> bytearray:
+        """Convert the string into keyboard reports. See `KeyboardLayoutBase.compile`."""
+        return self.layout.compile(string)
+
+    def keycodes(self, char: str) -> Sequence[int]:
+        """Return the keycodes needed to type the given character.
+        See `KeyboardLayoutBase.keycodes`."""
+        return self.layout.keycodes(char)
+
+
+class AsyncMouse(_ReportRelay):
+    """Send HID mouse reports, awaiting each send. See `Mouse`."""
+
+    def __init__(self, devices: Sequence[object], **kwargs) -> None:
+        """Create an AsyncMouse object that will send mouse HID reports.
+
+        :param devices: A sequence of devices that includes a mouse device,
+          or a mouse device itself.
+        :param kwargs: Other arguments given to `Mouse`, like ``extended``.
+        """
+        super().__init__(_match_device(devices, 0x1, 0x02))
+        self.mouse = Mouse(self, **kwargs)
+        """The `Mouse` building the reports."""
+
+    async def press(self, buttons: int) -> None:
+        """Press the given mouse buttons. See `Mouse.press`."""
+        self.mouse.press(buttons)
+        await self._flush()
+
+    async def release(self, buttons: int) -> None:
+        """Release the given mouse buttons. See `Mouse.release`."""
+        self.mouse.release(buttons)
+        await self._flush()
+
+    async def release_all(self) -> None:
+        """Release all the mouse buttons."""
+        self.mouse.release_all()
+        await self._flush()
+
+    async def click(self, buttons: int) -> None:
+        """Press and release the given mouse buttons. See `Mouse.click`."""
+        self.mouse.click(buttons)
+        await self._flush()
+
+    async def move(
+        self, x: float = 0, y: float = 0, wheel: float = 0, pan: float = 0
+    ) -> None:
+        """Move the mouse and turn the wheel as directed. See `Mouse.move`."""
+        self.mouse.move(x, y, wheel, pan)
+        await self._flush()
+
+    async def accumulate(
+        self, x: float = 0, y: float = 0, wheel: float = 0, pan: float = 0
+    ) -> None:
+        """Add motion to be sent later as a single report. See `Mouse.accumulate`."""
+        self.mouse.accumulate(x, y, wheel, pan)
+        await self._flush()
+
+    async def flush(self) -> None:
+        """Send one report with the motion accumulated so far. See `Mouse.flush`."""
+        self.mouse.flush()
+        await self._flush()
+
+
+class AsyncConsumerControl(_ReportRelay):
+    """Send ConsumerControl code reports, awaiting each send. See `ConsumerControl`."""
+
+    def __init__(self, devices: Sequence[object]) -> None:
+        """Create an AsyncConsumerControl object that will send Consumer Control reports.
+
+        :param devices: A sequence of devices that includes a Consumer Control device,
+          or a Consumer Control device itself.
+        """
+        super().__init__(_match_device(devices, 0x0C, 0x01))
+        self.consumer_control = ConsumerControl(self)
+        """The `ConsumerControl` building the reports."""
+
+    async def send(self, consumer_code: int) -> None:
+        """Press and release the given consumer control code."""
+        self.consumer_control.send(consumer_code)
+        await self._flush()
+
+    async def press(self, consumer_code: int) -> None:
+        """Press the given consumer control code. See `ConsumerControl.press`."""
+        self.consumer_control.press(consumer_code)
+        await self._flush()
+
+    async def release(self) -> None:
+        """Release the consumer control key."""
+        self.consumer_control.release()
+        await self._flush()
+
+
+class AsyncGamepad(_ReportRelay):
+    """Send Generic Gamepad HID reports, awaiting each send. See `Gamepad`.
+
+    The initial neutral report is sent by the first awaited call."""
+
+    def __init__(self, devices: Sequence[object]) -> None:
+        """Create an AsyncGamepad object that will send gamepad HID reports.
+
+        :param devices: A sequence of devices that includes a gamepad device,
+          or a gamepad device itself.
+        """
+        super().__init__(_match_device(devices, 0x1, 0x05))
+        self.gamepad = Gamepad(self)
+        """The `Gamepad` building the reports, and configuring its axes."""
+
+    async def press_buttons(self, *buttons: int) -> None:
+        """Press the given buttons. See `Gamepad.press_buttons`."""
+        self.gamepad.press_buttons(*buttons)
+        await self._flush()
+
+    async def release_buttons(self, *buttons: int) -> None:
+        """Release the given buttons. See `Gamepad.release_buttons`."""
+        self.gamepad.release_buttons(*buttons)
+        await self._flush()
+
+    async def release_all_buttons(self) -> None:
+        """Release all buttons."""
+        self.gamepad.release_all_buttons()
+        await self._flush()
+
+    async def move_hat(self, direction: int = Gamepad.HAT_NEUTRAL) -> None:
+        """Move the hat switch. See `Gamepad.move_hat`."""
+        self.gamepad.move_hat(direction)
+        await self._flush()
+
+    # pylint: disable=too-many-arguments, invalid-name
+    async def move_joysticks(
+        self, x=None, y=None, rx=None, ry=None, l2=None, r2=None
+    ) -> None:
+        """Set the joystick and trigger axis positions. See `Gamepad.move_joysticks`."""
+        self.gamepad.move_joysticks(x, y, rx, ry, l2, r2)
+        await self._flush()
+
+    async def set_axes(self, values: Sequence[int], first: int = 0) -> None:
+        """Set several consecutive axes at once. See `Gamepad.set_axes`."""
+        self.gamepad.set_axes(values, first)
+        await self._flush()
+
+    async def reset_all(self) -> None:
+        """Release all buttons, center joysticks and triggers, set hat to neutral."""
+        self.gamepad.reset_all()
+        await self._flush()
+
+    def batch(self):
+        """Stage changes made within an ``async with`` block, and send them as one report
+        when it ends. See `Gamepad.batch`.
+
+        Example::
+
+            async with gamepad.batch():
+                await gamepad.press_buttons(Gamepad.BUTTON_1)
+                await gamepad.move_joysticks(x=-127)
+        """
+        return self
+
+    async def __aenter__(self):
+        self.gamepad.__enter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.gamepad.__exit__(exc_type, exc_value, traceback)
+        await self._flush()
@@ -0,0 +1,128 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.coalescing_device.CoalescingDevice`
+====================================================
+
+* Author(s): quaxalber
+"""
+
+import time
+
+from . import _DeviceWrapper
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+# Usages of the Generic Desktop page whose reports hold relative motion: the pointer and
+# the mouse. Each of their reports matters, even when it repeats the previous one.
+_RELATIVE_USAGES = (0x01, 0x02)
+
+
+class CoalescingDevice(_DeviceWrapper):
+    """Wrap a HID device to drop reports identical to the last one sent and, optionally,
+    keep only the latest report when several are sent within one poll interval.
+
+    This only suits devices whose reports hold an absolute state, like keyboards,
+    gamepads or digitizers. A mouse report holds relative motion, so a repeated report
+    is new motion, not a duplicate: mice are refused. Use ``Mouse.accumulate`` to merge
+    their motion instead.
+    """
+
+    def __init__(self, device: object, *, interval: Optional[float] = None) -> None:
+        """Create a CoalescingDevice wrapping the given device.
+
+        :param device: The device to wrap: any object that implements ``send_report()``,
+          ``usage_page`` and ``usage``, such as one returned by `find_device`.
+        :param interval: Minimum time in seconds between two reports, usually the host
+          poll interval. Reports sent sooner are held back, and only the latest one is kept
+          until `update` or `flush` sends it. Defaults to None to send reports right away.
+        :raises ValueError: if the device is a mouse or pointer, reporting relative motion.
+
+        Holding reports back suits devices reporting an absolute state, like gamepads or
+        digitizers. A keyboard key pressed and released within one interval would be lost.
+
+        Example::
+
+            device = CoalescingDevice(
+                find_device(usb_hid.devices, usage_page=0x1, usage=0x05), interval=0.008
+            )
+            gamepad = Gamepad(device)
+            while True:
+                # ... update the gamepad as often as needed ...
+                device.update()
+        """
+        super().__init__(device)
+        if self.usage_page == 0x1 and self.usage in _RELATIVE_USAGES:
+            raise ValueError("Cannot coalesce the relative reports of a mouse.")
+        self.interval = interval
+
+        self.dropped = 0
+        """Number of reports not sent because they matched the last report sent."""
+        self.coalesced = 0
+        """Number of held back reports replaced by a newer one before being sent."""
+
+        # Last report sent and report held back, per report ID.
+        self._last_reports = {}
+        self._pending_reports = {}
+        self._last_send_time = None
+
+    def send_report(self, report: bytes, report_id: Optional[int] = None) -> None:
+        """Send the report, unless it matches the last report sent.
+
+        :param report: The report to send.
+        :param report_id: The report ID, if the wrapped device uses several report IDs.
+        """
+        pending = self._pending_reports
+        if report_id in pending:
+            # A newer state supersedes the one held back.
+            del pending[report_id]
+            self.coalesced += 1
+        if self.interval is not None and not self._interval_elapsed():
+            last = self._last_reports.get(report_id)
+            if last is not None and last == report:
+                self.dropped += 1
+            else:
+                pending[report_id] = bytes(report)
+            return
+        self._send(report, report_id)
+
+    def update(self) -> None:
+        """Send the reports held back, if the interval has elapsed.
+        Call this regularly, for instance from the main loop."""
+        if self._pending_reports and self._interval_elapsed():
+            self.flush()
+
+    def flush(self) -> None:
+        """Send the reports held back right away."""
+        pending = self._pending_reports
+        while pending:
+            report_id, report = pending.popitem()
+            self._send(report, report_id)
+
+    def _interval_elapsed(self) -> bool:
+        return (
+            self._last_send_time is None
+            or time.monotonic() - self._last_send_time >= self.interval
+        )
+
+    def _send(self, report: bytes, report_id: Optional[int]) -> None:
+        last = self._last_reports.get(report_id)
+        if last is not None and last == report:
+            self.dropped += 1
+            return
+        if report_id is None:
+            self._device.send_report(report)
+        else:
+            self._device.send_report(report, report_id)
+        if last is not None and len(last) == len(report):
+            # Remember what was sent, without allocating new storage.
+            last[:] = report
+        else:
+            self._last_reports[report_id] = bytearray(report)
+        if self.interval is not None:
+            self._last_send_time = time.monotonic()
@@ -33,6 +33,8 @@ class Gamepad:
     _REPORT_ID = 4
     # Report length definition (must match the descriptor for the input report)
     _REPORT_LENGTH = 10  # 1 (Report ID) + 2 (buttons) + 1 (hat) + 6 (axes)
+    # Rumble output report ID (must match the descriptor)
+    _RUMBLE_REPORT_ID = 5
 
     # pylint: disable=invalid-name
     # Suggested Button mapping based on common layouts and PS controller
@@ -64,8 +66,33 @@ class Gamepad:
     HAT_LEFT = 6
     HAT_TOP_LEFT = 7
     HAT_NEUTRAL = 8  # Value to send for neutral (outside 0-7 range)
+
+    # Axis numbers, in report order
+    AXIS_X = 0  # Left joystick X
+    AXIS_Y = 1  # Left joystick Y
+    AXIS_RX = 2  # Right joystick X
+    AXIS_RY = 3  # Right joystick Y
+    AXIS_L2 = 4  # Left trigger
+    AXIS_R2 = 5  # Right trigger
     # pylint: enable=invalid-name
 
+    # Report byte for each joystick value, indexed by value + 127.
+    # Maps -127..127 to 1..255, center is 128.
+    _JOYSTICK_TABLE = bytes(range(1, 256))
+    # Report byte for each trigger value, indexed by value.
+    # Maps 0..127 to 0..255: value * 255 / 127, rounded.
+    _TRIGGER_TABLE = bytes((value * 255 + 63) // 127 for value in range(128))
+    # Per axis: offset added to the value to get the table index, and range error.
+    _AXIS_OFFSETS = (127, 127, 127, 127, 0, 0)
+    _AXIS_ERRORS = (
+        "Axis value must be -127 to 127.",
+        "Axis value must be -127 to 127.",
+        "Axis value must be -127 to 127.",
+        "Axis value must be -127 to 127.",
+        "Trigger value must be 0 to 127.",
+        "Trigger value must be 0 to 127.",
+    )
+
     def __init__(self, devices):
         """Create a GenericGamepad object that will send USB HID reports.
 
@@ -90,8 +117,32 @@ class Gamepad:
         for i in range(4, 10):
             self._report[i] = 128
 
-        # Remember previous report state to avoid sending duplicates if desired
-        # self._last_report = bytes(self._report) # Optional optimization
+        # Lookup table giving the report byte of each axis.
+        self._axis_tables = [
+            self._JOYSTICK_TABLE,
+            self._JOYSTICK_TABLE,
+            self._JOYSTICK_TABLE,
+            self._JOYSTICK_TABLE,
+            self._TRIGGER_TABLE,
+            self._TRIGGER_TABLE,
+        ]
+        # Last raw value and calibrated center of each axis.
+        self._axis_values = [0, 0, 0, 0, 0, 0]
+        self._axis_centers = [0, 0, 0, 0, 0, 0]
+        # Squared radial deadzone radius of the left and right joysticks.
+        self._radial_deadzones = [0, 0]
+        # Whether any radial deadzone is set, checked first by the fast paths.
+        self._radial = False
+
+        # To avoid sending duplicate reports, wrap the device in a CoalescingDevice.
+
+        # Nesting depth of batch() contexts, and whether changes are waiting to be sent.
+        self._batch_depth = 0
+        self._batch_changed = False
+
+        # Last rumble intensity received, and functions called when it changes.
+        self._rumble_intensity = 0
+        self._rumble_callbacks = []
 
         # Send the initial neutral report
         self._send()
@@ -103,16 +154,43 @@ class Gamepad:
                        Defaults to None.
         """
         if report is None:
+            if self._batch_depth:
+                # Send once the outermost batch ends.
+                self._batch_changed = True
+                return
             report = self._report
 
-        # Optional optimization: only send if report changed
-        # current_report_bytes = bytes(report)
-        # if current_report_bytes == self._last_report:
-        #    return
-        # self._last_report = current_report_bytes
-
         self._gamepad_device.send_report(report)
 
+    def batch(self):
+        """Stage any number of button, hat and joystick changes, and send them as exactly
+        one report when the ``with`` block ends. Batches may be nested: the report is sent
+        when the outermost one ends, and only if something changed. Nothing is sent if the
+        block raises an exception.
+
+        Example::
+
+            with gamepad.batch():
+                gamepad.press_buttons(Gamepad.BUTTON_1)
+                gamepad.move_hat(Gamepad.HAT_LEFT)
+                gamepad.move_joysticks(x=-127, y=40)
+        """
+        return self
+
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._batch_depth -= 1
+        if exc_type is not None:
+            # Do not send a half-built report. The changes staged so far stay in the
+            # report, and are sent with the next change.
+            return
+        if not self._batch_depth and self._batch_changed:
+            self._batch_changed = False
+            self._send()
+
     def press_buttons(self, *buttons):
         """Press the given buttons.
 
@@ -165,12 +243,12 @@ class Gamepad:
         self._report[3] = (self._report[3] & 0xF0) | (direction & 0x0F)
         self._send()
 
-    # pylint: disable=too-many-locals
+    # pylint: disable=too-many-branches, too-many-statements, too-many-locals
     def move_joysticks(self, x=None, y=None, rx=None, ry=None, l2=None, r2=None):
         """Set the joystick and trigger axis positions.
         Axes are specified as integers from -127 to 127 (inclusive).
         Trigger pressure (l2, r2) are specified from 0 to 127 (inclusive).
-        ``None`` means leave the axis unchanged.
+        Fractional values are rounded. ``None`` means leave the axis unchanged.
 
         :param int x: Left joystick X axis (-127 to 127).
         :param int y: Left joystick Y axis (-127 to 127).
@@ -179,113 +257,350 @@ class Gamepad:
         :param int l2: Left trigger pressure (0 to 127). Maps to 0-255.
         :param int r2: Right trigger pressure (0 to 127). Maps to 0-255.
         """
-        # Map joystick values (-127 to 127) to HID report range (0 to 255)
-        # Map trigger values (0 to 127) to HID report range (0 to 255)
+        if self._radial:
+            self._move_axes((x, y, rx, ry, l2, r2))
+            return
+        # Look each axis given up in its table, and compare with the report.
         # Axis order in report: X, Y, RX, RY, L2(Z), R2(Rz) -> Indices 4, 5, 6, 7, 8, 9
-
+        report = self._report
+        tables = self._axis_tables
+        values = self._axis_values
         changed = False
-        if x is not None:
-            if not -127 <= x <= 127:
-                raise ValueError("Axis value must be -127 to 127.")
-            val = x + 128  # Map to 1-255, center is 128
-            if val == 256:
-                val = 255  # Cap at 255 for 127 input
-            if self._report[4] != val:
-                self._report[4] = val
-                changed = True
-        if y is not None:
-            if not -127 <= y <= 127:
-                raise ValueError("Axis value must be -127 to 127.")
-            val = y + 128  # Map to 1-255, center is 128
-            if val == 256:
-                val = 255
-            if self._report[5] != val:
-                self._report[5] = val
-                changed = True
-        if rx is not None:
-            if not -127 <= rx <= 127:
-                raise ValueError("Axis value must be -127 to 127.")
-            val = rx + 128  # Map to 1-255, center is 128
-            if val == 256:
-                val = 255
-            if self._report[6] != val:
-                self._report[6] = val
-                changed = True
-        if ry is not None:
-            if not -127 <= ry <= 127:
-                raise ValueError("Axis value must be -127 to 127.")
-            val = ry + 128  # Map to 1-255, center is 128
-            if val == 256:
-                val = 255
-            if self._report[7] != val:
-                self._report[7] = val
-                changed = True
-        if l2 is not None:
-            if not 0 <= l2 <= 127:
-                raise ValueError("Trigger value must be 0 to 127.")
-            # Map 0-127 -> 0-255. Simple scaling: value * 255 / 127
-            val = round(l2 * 255 / 127)
-            if val > 255:
-                val = 255  # Ensure bounds
-            if self._report[8] != val:
-                self._report[8] = val
-                changed = True
-        if r2 is not None:
-            if not 0 <= r2 <= 127:
-                raise ValueError("Trigger value must be 0 to 127.")
-            val = round(r2 * 255 / 127)
-            if val > 255:
-                val = 255
-            if self._report[9] != val:
-                self._report[9] = val
-                changed = True
+        try:
+            if x is not None:
+                if x < -127:
+                    # A negative index would wrap around.
+                    raise IndexError
+                value = tables[0][x + 127]
+                values[0] = x
+                if report[4] != value:
+                    report[4] = value
+                    changed = True
+            if y is not None:
+                if y < -127:
+                    raise IndexError
+                value = tables[1][y + 127]
+                values[1] = y
+                if report[5] != value:
+                    report[5] = value
+                    changed = True
+            if rx is not None:
+                if rx < -127:
+                    raise IndexError
+                value = tables[2][rx + 127]
+                values[2] = rx
+                if report[6] != value:
+                    report[6] = value
+                    changed = True
+            if ry is not None:
+                if ry < -127:
+                    raise IndexError
+                value = tables[3][ry + 127]
+                values[3] = ry
+                if report[7] != value:
+                    report[7] = value
+                    changed = True
+            if l2 is not None:
+                if l2 < 0:
+                    raise IndexError
+                value = tables[4][l2]
+                values[4] = l2
+                if report[8] != value:
+                    report[8] = value
+                    changed = True
+            if r2 is not None:
+                if r2 < 0:
+                    raise IndexError
+                value = tables[5][r2]
+                values[5] = r2
+                if report[9] != value:
+                    report[9] = value
+                    changed = True
+        except (IndexError, TypeError):
+            # A fractional or out of range value: round and check each value.
+            self._move_axes((x, y, rx, ry, l2, r2), changed)
+            return
 
         if changed:
             self._send()
 
+    def set_axes(self, values, first=0):
+        """Set several consecutive axes at once, and send a report if any of them changed.
+
+        :param values: Sequence of axis values, in the ranges given for `move_joysticks`.
+        :param int first: Axis of the first value, like ``Gamepad.AXIS_X``.
+                          The following values go to the following axes, in report order
+                          ``AXIS_X``, ``AXIS_Y``, ``AXIS_RX``, ``AXIS_RY``, ``AXIS_L2``,
+                          ``AXIS_R2``. Defaults to ``AXIS_X``.
+
+        Example::
+
+            # Set both sticks from one sample of four values.
+            gamepad.set_axes(stick_sample)
+            # Set both triggers.
+            gamepad.set_axes((l2, r2), Gamepad.AXIS_L2)
+        """
+        count = len(values)
+        if not 0 <= first <= first + count <= 6:
+            raise ValueError("Axes must be within AXIS_X to AXIS_R2.")
+        report = self._report
+        tables = self._axis_tables
+        offsets = self._AXIS_OFFSETS
+        axis_values = self._axis_values
+        changed = False
+        if not self._radial:
+            try:
+                axis = first
+                for value in values:
+                    index = value + offsets[axis]
+                    if index < 0:
+                        raise IndexError
+                    report_value = tables[axis][index]
+                    axis_values[axis] = value
+                    if report[4 + axis] != report_value:
+                        report[4 + axis] = report_value
+                        changed = True
+                    axis += 1
+            except (IndexError, TypeError):
+                pass
+            else:
+                if changed:
+                    self._send()
+                return
+        # A radial deadzone, or a fractional or out of range value.
+        given = [None, None, None, None, None, None]
+        given[first : first + count] = values
+        self._move_axes(given, changed)
+
+    def _move_axes(self, values, changed=False):
+        """Set the axes given, checking and rounding each value, and send a report
+        if any of them changed.
+
+        :param values: Six axis values in report order, None to leave an axis unchanged.
+        :param bool changed: True if the report already changed and must be sent.
+        """
+        axes = 0
+        for axis in range(6):
+            if values[axis] is not None:
+                axes |= self._store_axis(axis, values[axis])
+        if self._encode_axes(axes) or changed:
+            self._send()
+
+    def configure_axis(self, axis, *, center=0, span=None, deadzone=0, curve=None):
+        """Calibrate an axis and set its deadzone and response curve.
+
+        Values given to `move_joysticks` and `set_axes` then go through this pipeline
+        before being compared with the last report, so noise within the deadzone
+        does not cause new reports. Everything is precomputed into the lookup table
+        of the axis: sending a value costs the same whatever the settings. The current
+        value of the axis is encoded again, and sent if its report byte changed.
+
+        :param int axis: The axis to configure, like ``Gamepad.AXIS_X``.
+        :param int center: Raw value of the axis at rest. Defaults to 0.
+        :param int span: Raw distance from ``center`` to full deflection (or full pressure
+                         for a trigger). Values beyond are clamped. The span is limited on
+                         each side of ``center`` to the distance to the end of the raw
+                         range (-127 to 127, or 0 to 127 for a trigger), so that the end
+                         of the range always gives full deflection. Defaults to None for
+                         that distance.
+        :param int deadzone: Raw distance from ``center`` within which the axis stays at
+                             rest. The remaining travel is rescaled to the full range.
+                             Defaults to 0.
+        :param curve: Response curve applied to the deflection, from 0 to 1:
+                      ``None`` for linear (the default), a number for an exponential
+                      curve (the deflection raised to that power, like ``2.0``), or a
+                      sequence of 128 values from 0 to 127 mapping the deflection
+                      (scaled to 0-127) to the output (scaled to 0-127).
+
+        Example::
+
+            # Left stick rests slightly off center and jitters by about 4 units.
+            gamepad.configure_axis(Gamepad.AXIS_X, center=3, deadzone=4, curve=2.0)
+        """
+        if not 0 <= axis <= self.AXIS_R2:
+            raise ValueError("Axis must be AXIS_X to AXIS_R2.")
+        if (
+            curve is not None
+            and not isinstance(curve, (int, float))
+            and len(curve) != 128
+        ):
+            raise ValueError("Curve table must have 128 values.")
+        offset = self._AXIS_OFFSETS[axis]
+        if not 0 <= center + offset < len(self._axis_tables[axis]):
+            raise ValueError(self._AXIS_ERRORS[axis])
+
+        # Joysticks map -127..127 to 1..255 around 128, triggers map 0..127 to 0..255.
+        joystick = offset != 0
+        size = 255 if joystick else 128
+        # Span above and below the center, within the raw range. Triggers below their
+        # center stay at rest.
+        spans = (127 - center, center + offset if joystick else 127 - center)
+        if span is not None:
+            spans = (min(span, spans[0]), min(span, spans[1]))
+        if not 0 <= deadzone < min(spans):
+            raise ValueError("Deadzone must be at least 0 and less than span.")
+        table = bytearray(size)
+        for index in range(size):
+            distance = index - offset - center
+            side_span = spans[0] if distance >= 0 else spans[1]
+            deflection = (abs(distance) - deadzone) / (side_span - deadzone)
+            deflection = min(1.0, max(0.0, deflection))
+            if curve is None:
+                level = round(deflection * 127)
+            elif isinstance(curve, (int, float)):
+                level = round(deflection**curve * 127)
+            else:
+                level = curve[round(deflection * 127)]
+            if joystick:
+                table[index] = 128 + level if distance >= 0 else 128 - level
+            else:
+                table[index] = (level * 255 + 63) // 127 if distance >= 0 else 0
+        self._axis_tables[axis] = table
+        self._axis_centers[axis] = center
+        if self._encode_axes(1 << axis):
+            self._send()
+
+    def set_radial_deadzone(self, axis, radius):
+        """Keep a joystick at rest while its raw position stays within ``radius`` of the
+        calibrated center, considering both of its axes together.
+
+        :param int axis: ``Gamepad.AXIS_X`` for the left joystick or ``Gamepad.AXIS_RX``
+                         for the right one.
+        :param int radius: Raw distance from the center, 0 to disable. Defaults to 0.
+        """
+        if axis not in (self.AXIS_X, self.AXIS_RX):
+            raise ValueError("Axis must be AXIS_X or AXIS_RX.")
+        self._radial_deadzones[axis >> 1] = radius * radius
+        self._radial = bool(self._radial_deadzones[0] or self._radial_deadzones[1])
+
+    def _store_axis(self, axis, value):
+        """Validate and store the raw value of one axis.
+
+        :returns: the bit for this axis, to pass to `_encode_axes`.
+        """
+        if not isinstance(value, int):
+            # The tables are indexed by integers: round fractional values.
+            value = round(value)
+        if not 0 <= value + self._AXIS_OFFSETS[axis] < len(self._axis_tables[axis]):
+            raise ValueError(self._AXIS_ERRORS[axis])
+        self._axis_values[axis] = value
+        return 1 << axis
+
+    def _encode_axes(self, axes):
+        """Store the report bytes of the given axes, looked up in the axis tables.
+
+        :param int axes: Bit mask of the axes to encode, as returned by `_store_axis`.
+        :returns: True if the report changed.
+        """
+        values = self._axis_values
+        centers = self._axis_centers
+        # Axis order in report: X, Y, RX, RY, L2(Z), R2(Rz) -> Indices 4, 5, 6, 7, 8, 9
+        report = self._report
+        # Joysticks within their radial deadzone are encoded from their centers instead.
+        centered = 0
+        if self._radial:
+            for stick in range(2):
+                axis = stick << 1
+                radius_squared = self._radial_deadzones[stick]
+                if radius_squared and axes & (3 << axis):
+                    # Both axes of the joystick may change.
+                    axes |= 3 << axis
+                    distance_x = values[axis] - centers[axis]
+                    distance_y = values[axis + 1] - centers[axis + 1]
+                    if (
+                        distance_x * distance_x + distance_y * distance_y
+                        < radius_squared
+                    ):
+                        centered |= 3 << axis
+
+        changed = False
+        axis = 0
+        while axes:
+            if axes & 1:
+                value = centers[axis] if centered & (1 << axis) else values[axis]
+                report_value = self._axis_tables[axis][value + self._AXIS_OFFSETS[axis]]
+                if report[4 + axis] != report_value:
+                    report[4 + axis] = report_value
+                    changed = True
+            axes >>= 1
+            axis += 1
+        return changed
+
     def reset_all(self):
-        """Release all buttons, center joysticks and triggers, set hat to neutral."""
-        self.release_all_buttons()
-        self.move_joysticks(x=0, y=0, rx=0, ry=0, l2=0, r2=0)
-        self.move_hat(self.HAT_NEUTRAL)
-        # Note: move_joysticks already calls _send if changes were made.
-        # We might need one final send if only hat/buttons changed,
-        # but the individual methods handle sending. A final call doesn't hurt.
-        self._send()
+        """Release all buttons, center joysticks and triggers, set hat to neutral.
+        Sends exactly one report."""
+        with self.batch():
+            self.release_all_buttons()
+            self.move_joysticks(x=0, y=0, rx=0, ry=0, l2=0, r2=0)
+            self.move_hat(self.HAT_NEUTRAL)
+            # Always send a report, even if nothing changed.
+            self._send()
 
     # --- Handling Output Reports (Rumble) ---
-    # This requires periodically checking the device for received reports.
-    # The `adafruit_hid` library doesn't provide a direct callback mechanism.
-    # You would typically poll `_gamepad_device.get_last_received_report(RUMBLE_REPORT_ID)`
-    # in your main loop.
+    # The host sends rumble as an output report, which the device only stores.
+    # update() reads it and calls the rumble callbacks when the intensity changes.
+
+    def update(self):
+        """Read the rumble report sent by the host, and call the functions added with
+        `add_rumble_callback` if the intensity changed. Call this regularly, for instance
+        from the main loop, when rumble callbacks are used.
+
+        Returns True if the intensity changed.
+        """
+        intensity = self._rumble_intensity
+        self.get_received_rumble_report()
+        return self._rumble_intensity != intensity
+
+    def add_rumble_callback(self, callback):
+        """Call the given function whenever the host changes the rumble intensity.
+
+        :param callback: A function taking the new intensity (0-255). It is called from
+          `update`, or from `get_received_rumble_report`.
+
+        Example::
+
+            def rumble(intensity):
+                motor.throttle = intensity / 255
+
+            gp.add_rumble_callback(rumble)
+            while True:
+                gp.update()
+        """
+        self._rumble_callbacks.append(callback)
+
+    def remove_rumble_callback(self, callback):
+        """Stop calling a function added with `add_rumble_callback`."""
+        self._rumble_callbacks.remove(callback)
 
     def get_received_rumble_report(self):
-        """Check for and return the last received rumble report (Output Report ID 2).
+        """Check for and return the last received rumble report (Output Report ID 5).
 
-        Returns a bytearray containing the report (Report ID + Rumble Byte),
-        or None if no report has been received since the last check.
+        Returns the report as received: the rumble byte, as returned by ``usb_hid.Device``,
+        or the Report ID followed by the rumble byte on backends that include the ID.
+        Returns None if no report has been received since the last check.
+        The rumble callbacks are called if the intensity changed.
 
         NOTE: This relies on underlying USB stack behavior and might need
               adjustments based on the specific CircuitPython port/version.
-              The user needs to call this periodically in their main loop.
         """
-        RUMBLE_REPORT_ID = 5  # As defined in descriptor
         try:
-            # This method might not exist or work reliably on all ports.
-            # It's an attempt to get the output report data.
-            report = self._gamepad_device.get_last_received_report(RUMBLE_REPORT_ID)
-            # report includes the report ID if received successfully.
-            if report and len(report) == 2 and report[0] == RUMBLE_REPORT_ID:
-                return report  # Return the full report [ID, Value]
-            return None
+            report = self._gamepad_device.get_last_received_report(
+                self._RUMBLE_REPORT_ID
+            )
         except (AttributeError, NotImplementedError, ConnectionError):
             # Method not available or device issue
-            # print("WARN: get_last_received_report not available or failed.")
             return None
-        except Exception as e:
-            # Catch other potential low-level errors
-            # print(f"WARN: Error checking for rumble report: {e}")
+        # The rumble byte comes last, after the report ID if the backend includes it.
+        if not report or len(report) > 2:
+            return None
+        if len(report) == 2 and report[0] != self._RUMBLE_REPORT_ID:
             return None
+        intensity = report[-1]
+        if intensity != self._rumble_intensity:
+            self._rumble_intensity = intensity
+            for callback in self._rumble_callbacks:
+                callback(intensity)
+        return report
 
     def get_rumble_intensity(self):
         """Checks for and returns the latest rumble intensity (0-255) received from the host.
@@ -294,5 +609,5 @@ class Gamepad:
         """
         report = self.get_received_rumble_report()
         if report:
-            return report[1]  # Return the second byte (the data)
+            return report[-1]  # Return the last byte (the data)
         return None
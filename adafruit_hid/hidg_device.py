@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.hidg_device.HidgDevice`
+====================================================
+
+* Author(s): quaxalber
+"""
+
+import os
+import select
+import time
+
+try:
+    from typing import Optional, Sequence, Union
+except ImportError:
+    pass
+
+
+# pylint: disable=too-many-arguments, too-many-instance-attributes
+class HidgDevice:
+    """A HID device backed by a Linux USB gadget character device, such as ``/dev/hidg0``.
+
+    Reports are written straight to the file descriptor, without a Python file object
+    or buffering. Output reports sent by the host, such as keyboard LEDs or gamepad
+    rumble, are read without blocking by `get_last_received_report`. It implements the
+    same interface as ``usb_hid.Device``.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, int],
+        *,
+        usage_page: int,
+        usage: int,
+        report_ids: Sequence[int] = (0,),
+        in_report_lengths: Sequence[int] = (8,),
+        out_report_lengths: Sequence[int] = (0,),
+        write_timeout: Optional[float] = None,
+    ) -> None:
+        """Open the gadget device.
+
+        :param path: Path of the character device, such as ``"/dev/hidg0"``, or a file
+          descriptor already open for reading and writing.
+        :param usage_page: The usage page of the device, as in its report descriptor.
+        :param usage: The usage of the device, as in its report descriptor.
+        :param report_ids: The report IDs used by the device, or ``(0,)`` if the report
+          descriptor has no report ID, as for ``usb_hid.Device``.
+        :param in_report_lengths: The length of the input reports, for each report ID.
+        :param out_report_lengths: The length of the output reports, for each report ID,
+          or 0 if there is no output report with that ID.
+        :param write_timeout: Time in seconds to wait for the host to read a report when
+          the device is busy, before raising `OSError`. Defaults to None to wait
+          indefinitely, like ``usb_hid.Device``. Use 0 to never wait.
+
+        Example::
+
+            keyboard = Keyboard(
+                HidgDevice("/dev/hidg0", usage_page=0x1, usage=0x06, out_report_lengths=(1,))
+            )
+        """
+        if isinstance(path, int):
+            self._fd = path
+            self._path = "fd {}".format(path)
+        else:
+            self._fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
+            self._path = path
+        os.set_blocking(self._fd, False)
+
+        self.usage_page = usage_page
+        self.usage = usage
+        self.write_timeout = write_timeout
+        self._report_ids = tuple(report_ids)
+        self._in_report_lengths = tuple(in_report_lengths)
+        self._numbered = self._report_ids != (0,)
+
+        # Last output report received for each report ID with output reports,
+        # and whether it has been received since the last call to get_last_received_report.
+        self._out_reports = {}
+        self._out_fresh = {}
+        for report_id, length in zip(self._report_ids, out_report_lengths):
+            if length:
+                self._out_reports[report_id] = bytearray(length)
+                self._out_fresh[report_id] = False
+        # Output reports are read into this buffer, after the report ID if there is one.
+        self._read_buffer = bytearray(
+            max(out_report_lengths, default=0) + self._numbered
+        )
+        self._read_buffers = [self._read_buffer]
+        # Report ID prepended to numbered input reports with os.writev().
+        self._report_id_byte = bytearray(1)
+        self._write_buffers = [self._report_id_byte, None]
+
+    def __str__(self):
+        return "HidgDevice({})".format(self._path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def fileno(self) -> int:
+        """The file descriptor of the device, to wait for output reports with `select`."""
+        return self._fd
+
+    def close(self) -> None:
+        """Close the device."""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def send_report(self, report: bytes, report_id: Optional[int] = None) -> None:
+        """Send an input report to the host.
+
+        :param report: The report to send, without its report ID.
+        :param report_id: The report ID. Defaults to None for the first report ID.
+        :raises OSError: if the host did not read the report within ``write_timeout``.
+        """
+        if report_id is None:
+            report_id = self._report_ids[0]
+        if report_id:
+            self._report_id_byte[0] = report_id
+            self._write_buffers[1] = report
+            self._write(self._write_buffers)
+            self._write_buffers[1] = None
+        else:
+            self._write(report)
+
+    def send_reports(self, reports: bytes, report_id: Optional[int] = None) -> None:
+        """Send several input reports of the same report ID, one after the other.
+
+        :param reports: The reports to send, concatenated.
+        :param report_id: The report ID. Defaults to None for the first report ID.
+        :raises ValueError: if the length of ``reports`` is not a multiple of the report
+          length.
+        """
+        if report_id is None:
+            report_id = self._report_ids[0]
+        length = self._in_report_lengths[self._report_ids.index(report_id)]
+        if len(reports) % length:
+            raise ValueError("Reports length must be a multiple of {}.".format(length))
+        view = memoryview(reports)
+        # The gadget driver sends one report per write(): they cannot be joined.
+        for start in range(0, len(reports), length):
+            self.send_report(view[start : start + length], report_id)
+
+    def get_last_received_report(
+        self, report_id: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Return the last output report received for the given report ID, or None if no
+        report was received since the last call.
+
+        :param report_id: The report ID. Defaults to None for the first report ID with
+          output reports.
+        """
+        self.read_output_reports()
+        if report_id is None:
+            report_id = next(iter(self._out_reports), None)
+        if not self._out_fresh.get(report_id):
+            return None
+        self._out_fresh[report_id] = False
+        return bytes(self._out_reports[report_id])
+
+    def read_output_reports(self, timeout: float = 0) -> int:
+        """Read the output reports sent by the host.
+
+        :param timeout: Time in seconds to wait for a first output report. Defaults to 0 to
+          only read the reports already received.
+        :returns: the number of reports read.
+        """
+        if not self._out_reports:
+            return 0
+        if timeout and not select.select((self._fd,), (), (), timeout)[0]:
+            return 0
+        read = 0
+        buffer = self._read_buffer
+        while True:
+            try:
+                count = os.readv(self._fd, self._read_buffers)
+            except BlockingIOError:
+                return read
+            if not count:
+                return read
+            read += 1
+            report_id = buffer[0] if self._numbered else 0
+            report = self._out_reports.get(report_id)
+            if report is None:
+                continue
+            offset = int(self._numbered)
+            length = min(len(report), count - offset)
+            report[:length] = buffer[offset : offset + length]
+            self._out_fresh[report_id] = True
+
+    def _write(self, data) -> None:
+        """Write a report, waiting up to ``write_timeout`` while the device is busy."""
+        deadline = None
+        while True:
+            try:
+                if isinstance(data, list):
+                    os.writev(self._fd, data)
+                else:
+                    os.write(self._fd, data)
+                return
+            except BlockingIOError:
+                if self.write_timeout is None:
+                    remaining = None
+                else:
+                    if deadline is None:
+                        deadline = time.monotonic() + self.write_timeout
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise
+                select.select((), (self._fd,), (), remaining)
@@ -16,14 +16,31 @@ from .keycode import Keycode
 from . import find_device
 
 try:
-    from typing import Sequence
+    from typing import Callable, Sequence
     import usb_hid
 except ImportError:
     pass
 
 _MAX_KEYPRESSES = const(6)
+# Keycode reported in every key slot when too many keys are pressed.
+_ERROR_ROLL_OVER = const(0x01)
+# Looked up once: getting a class method from its class allocates a bound method.
+_modifier_bit = Keycode.modifier_bit
 
 
+def _first_free_slots() -> bytes:
+    """Return the index of the lowest free key slot, for each 6-bit mask of free slots."""
+    table = bytearray(64)
+    for mask in range(1, 64):
+        while not mask >> table[mask] & 1:
+            table[mask] += 1
+    return bytes(table)
+
+
+_FIRST_FREE_SLOT = _first_free_slots()
+
+
+# pylint: disable=too-many-instance-attributes
 class Keyboard:
     """Send HID keyboard reports."""
 
@@ -36,13 +53,66 @@ class Keyboard:
     LED_COMPOSE = 0x08
     """LED Usage ID for Compose"""
 
-    # No more than _MAX_KEYPRESSES regular keys may be pressed at once.
-
-    def __init__(self, devices: Sequence[usb_hid.Device], timeout: int = None) -> None:
+    OVERFLOW_EVICT_OLDEST = 0
+    """When a seventh regular key is pressed, release the key pressed first."""
+    OVERFLOW_DROP_NEWEST = 1
+    """When a seventh regular key is pressed, ignore it."""
+    OVERFLOW_ERROR_ROLLOVER = 2
+    """When more than six regular keys are pressed, report ErrorRollOver in every key slot,
+    as the HID specification requires, until enough keys are released."""
+
+    # fmt: off
+    NKRO_REPORT_DESCRIPTOR = bytes(
+        (
+            0x05, 0x01,  # Usage Page (Generic Desktop)
+            0x09, 0x06,  # Usage (Keyboard)
+            0xA1, 0x01,  # Collection (Application)
+            0x05, 0x07,  #   Usage Page (Keyboard)
+            0x19, 0xE0,  #   Usage Minimum (Left Control)
+            0x29, 0xE7,  #   Usage Maximum (Right GUI)
+            0x15, 0x00,  #   Logical Minimum (0)
+            0x25, 0x01,  #   Logical Maximum (1)
+            0x75, 0x01,  #   Report Size (1)
+            0x95, 0x08,  #   Report Count (8)
+            0x81, 0x02,  #   Input (Data, Variable, Absolute)
+            0x19, 0x00,  #   Usage Minimum (0)
+            0x29, 0xDF,  #   Usage Maximum (0xDF)
+            0x95, 0xE0,  #   Report Count (224)
+            0x81, 0x02,  #   Input (Data, Variable, Absolute)
+            0x05, 0x08,  #   Usage Page (LEDs)
+            0x19, 0x01,  #   Usage Minimum (Num Lock)
+            0x29, 0x05,  #   Usage Maximum (Kana)
+            0x95, 0x05,  #   Report Count (5)
+            0x91, 0x02,  #   Output (Data, Variable, Absolute)
+            0x95, 0x03,  #   Report Count (3)
+            0x91, 0x01,  #   Output (Constant)
+            0xC0,        # End Collection
+        )
+    )
+    # fmt: on
+    """Report descriptor for a keyboard created with ``nkro=True``: the modifiers, then
+    one bit for each key from 0x00 to 0xDF, in a 29-byte report."""
+
+    # No more than _MAX_KEYPRESSES regular keys may be pressed at once,
+    # unless the keyboard uses NKRO reports.
+
+    def __init__(
+        self,
+        devices: Sequence[usb_hid.Device],
+        timeout: int = None,
+        overflow: int = OVERFLOW_EVICT_OLDEST,
+        nkro: bool = False,
+    ) -> None:
         """Create a Keyboard object that will send keyboard HID reports.
 
         :param timeout: Time in seconds to wait for USB to become ready before timing out.
           Defaults to None to wait indefinitely.
+        :param overflow: What to do when more than six regular keys are pressed:
+          `OVERFLOW_EVICT_OLDEST` (the default), `OVERFLOW_DROP_NEWEST` or
+          `OVERFLOW_ERROR_ROLLOVER`.
+        :param nkro: Send N-key rollover reports for a device using
+          `NKRO_REPORT_DESCRIPTOR`, where any number of keys can be pressed at once.
+          Defaults to False for the usual 8-byte boot keyboard report.
 
         Devices can be a sequence of devices that includes a keyboard device or a keyboard device
         itself. A device is any object that implements ``send_report()``, ``usage_page`` and
@@ -53,21 +123,40 @@ class Keyboard:
         )
 
         # Reuse this bytearray to send keyboard reports.
-        self.report = bytearray(8)
-
         # report[0] modifiers
         # report[1] unused
         # report[2:8] regular key presses
+        # NKRO reports:
+        # report[0] modifiers
+        # report[1:29] one bit per regular key pressed, from 0x00 to 0xDF
+        self._nkro = nkro
+        self.report = bytearray(29 if nkro else 8)
 
         # View onto byte 0 in report.
         self.report_modifier = memoryview(self.report)[0:1]
 
         # List of regular keys currently pressed.
-        # View onto bytes 2-7 in report.
-        self.report_keys = memoryview(self.report)[2:]
+        # View onto bytes 2-7 in report, or onto the key bits of NKRO reports.
+        self.report_keys = memoryview(self.report)[1 if nkro else 2 :]
+
+        self.overflow = overflow
+        # One bit per regular key pressed, and the number of keys pressed.
+        self._pressed_keys = bytearray(32)
+        self._pressed_count = 0
+        # Slot + 1 of each key in report_keys, or 0 if the key has no slot.
+        self._key_slots = bytearray(256)
+        # One bit per free slot in report_keys.
+        self._free_slots = 0x3F
+        # Slots of the keys in report_keys in the order they were pressed, oldest first.
+        self._slot_order = bytearray(_MAX_KEYPRESSES)
+        self._ordered = 0
+        # True when report_keys changed without updating the tracking above.
+        self._keys_stale = False
 
         # No keyboard LEDs on.
         self._led_status = b"\x00"
+        # Functions called with the new LED bits when the host changes the LEDs.
+        self._led_callbacks = []
 
     def __str__(self):
         return str(self._keyboard_device)
@@ -76,10 +165,10 @@ class Keyboard:
         """Send a report indicating that the given keys have been pressed.
 
         :param keycodes: Press these keycodes all at once.
-        :raises ValueError: if more than six regular keys are pressed.
 
         Keycodes may be modifiers or regular keys.
-        No more than six regular keys may be pressed simultaneously.
+        No more than six regular keys may be pressed simultaneously:
+        the ``overflow`` policy decides what happens beyond that.
 
         Examples::
 
@@ -114,10 +203,34 @@ class Keyboard:
             self._remove_keycode_from_report(keycode)
         self._keyboard_device.send_report(self.report)
 
+    def press_key(self, keycode: int) -> None:
+        """Send a report indicating that the given key has been pressed.
+
+        :param keycode: Press this keycode, a modifier or a regular key.
+
+        Same as ``press(keycode)``, without building an argument tuple: use it in loops
+        that must not allocate memory.
+        """
+        self._add_keycode_to_report(keycode)
+        self._keyboard_device.send_report(self.report)
+
+    def release_key(self, keycode: int) -> None:
+        """Send a report indicating that the given key has been released.
+
+        :param keycode: Release this keycode. It is ignored if it was not pressed.
+
+        Same as ``release(keycode)``, without building an argument tuple.
+        """
+        self._remove_keycode_from_report(keycode)
+        self._keyboard_device.send_report(self.report)
+
     def release_all(self) -> None:
         """Release all pressed keys."""
-        for i in range(8):
-            self.report[i] = 0
+        self._forget_keys()
+        report = self.report
+        size = len(report)
+        for i in range(size):
+            report[i] = 0
         self._keyboard_device.send_report(self.report)
 
     def send(self, *keycodes: int) -> None:
@@ -128,62 +241,249 @@ class Keyboard:
         self.press(*keycodes)
         self.release_all()
 
+    def send_reports(self, reports: bytes) -> None:
+        """Send ready-made 8-byte keyboard reports, one after the other.
+
+        :param reports: A buffer holding one or more consecutive keyboard reports,
+          such as the one returned by `KeyboardLayoutBase.compile`.
+        :raises ValueError: if the buffer length is not a multiple of 8.
+
+        The keyboard state is left matching the last report sent. An NKRO keyboard
+        converts each report to an NKRO report before sending it.
+        """
+        size = 8
+        length = len(reports)
+        if length % size:
+            raise ValueError(
+                "Report buffer length must be a multiple of {}.".format(size)
+            )
+        if self._nkro:
+            self._send_nkro_reports(reports)
+            return
+        if length == size:
+            # A single report, as sent by KeyboardLayoutBase.write(): no slicing needed.
+            self._keyboard_device.send_report(reports)
+            self._forget_keys()
+            report = self.report
+            # A while loop: a range would be allocated on each report.
+            i = 0
+            while i < size:
+                report[i] = reports[i]
+                i += 1
+            return
+        if not length:
+            return
+        view = memoryview(reports)
+        send_report = self._keyboard_device.send_report
+        for start in range(0, length, size):
+            send_report(view[start : start + size])
+        self._forget_keys()
+        self.report[:] = view[length - size :]
+
+    def _send_nkro_reports(self, reports: bytes) -> None:
+        """Convert 8-byte keyboard reports to NKRO reports and send them."""
+        report = self.report
+        send_report = self._keyboard_device.send_report
+        for start in range(0, len(reports), 8):
+            if start:
+                # Only the keys of the previous report are set.
+                for i in range(start - 6, start):
+                    keycode = reports[i]
+                    if keycode < 0xE0:
+                        report[1 + (keycode >> 3)] &= 0xFF ^ (1 << (keycode & 7))
+            else:
+                for i in range(1, len(report)):
+                    report[i] = 0
+            report[0] = reports[start]
+            for i in range(start + 2, start + 8):
+                keycode = reports[i]
+                if keycode and keycode < 0xE0:
+                    report[1 + (keycode >> 3)] |= 1 << (keycode & 7)
+            send_report(report)
+
     def _add_keycode_to_report(self, keycode: int) -> None:
         """Add a single keycode to the USB HID report."""
-        modifier = Keycode.modifier_bit(keycode)
+        modifier = _modifier_bit(keycode)
         if modifier:
             # Set bit for this modifier.
             self.report_modifier[0] |= modifier
-        else:
-            report_keys = self.report_keys
-            # Don't press twice.
-            for i in range(_MAX_KEYPRESSES):
-                report_key = report_keys[i]
-                if report_key == 0:
-                    # Put keycode in first empty slot. Since the report_keys
-                    # are compact and unique, this is not a repeated key
-                    report_keys[i] = keycode
-                    return
-                if report_key == keycode:
-                    # Already pressed.
-                    return
-            # All slots are filled. Shuffle down and reuse last slot
-            for i in range(_MAX_KEYPRESSES - 1):
-                report_keys[i] = report_keys[i + 1]
-            report_keys[-1] = keycode
+            return
+        if self._nkro:
+            if 0 < keycode < 0xE0:
+                self.report_keys[keycode >> 3] |= 1 << (keycode & 7)
+            return
+        if self._keys_stale:
+            self._track_keys()
+        pressed_keys = self._pressed_keys
+        bit = 1 << (keycode & 7)
+        if pressed_keys[keycode >> 3] & bit or not keycode:
+            # Already pressed.
+            return
+        if self._pressed_count >= _MAX_KEYPRESSES:
+            overflow = self.overflow
+            if overflow == self.OVERFLOW_DROP_NEWEST:
+                return
+            if overflow == self.OVERFLOW_ERROR_ROLLOVER:
+                # Keep track of the key, but report that too many keys are pressed.
+                pressed_keys[keycode >> 3] |= bit
+                self._pressed_count += 1
+                report_keys = self.report_keys
+                for i in range(_MAX_KEYPRESSES):
+                    report_keys[i] = _ERROR_ROLL_OVER
+                return
+            # Release the oldest key to make room.
+            self._remove_keycode_from_report(self.report_keys[self._slot_order[0]])
+        pressed_keys[keycode >> 3] |= bit
+        self._pressed_count += 1
+        slot = _FIRST_FREE_SLOT[self._free_slots]
+        self._free_slots &= 0x3F ^ (1 << slot)
+        self._key_slots[keycode] = slot + 1
+        self._slot_order[self._ordered] = slot
+        self._ordered += 1
+        self.report_keys[slot] = keycode
 
     def _remove_keycode_from_report(self, keycode: int) -> None:
         """Remove a single keycode from the report."""
-        modifier = Keycode.modifier_bit(keycode)
+        modifier = _modifier_bit(keycode)
         if modifier:
             # Turn off the bit for this modifier.
-            self.report_modifier[0] &= ~modifier
-        else:
-            report_keys = self.report_keys
-            # Clear the at most one matching slot and move remaining keys down
-            j = 0
-            for i in range(_MAX_KEYPRESSES):
-                pressed = report_keys[i]
-                if not pressed:
-                    break  # Handled all used report slots
-                if pressed == keycode:
-                    continue  # Remove this entry
-                if i != j:
-                    report_keys[j] = report_keys[i]
-                j += 1
-            # Clear any remaining slots
-            while j < _MAX_KEYPRESSES and report_keys[j]:
-                report_keys[j] = 0
-                j += 1
+            self.report_modifier[0] &= 0xFF ^ modifier
+            return
+        if self._nkro:
+            if keycode < 0xE0:
+                self.report_keys[keycode >> 3] &= 0xFF ^ (1 << (keycode & 7))
+            return
+        if self._keys_stale:
+            self._track_keys()
+        pressed_keys = self._pressed_keys
+        bit = 1 << (keycode & 7)
+        if not pressed_keys[keycode >> 3] & bit:
+            # Not pressed.
+            return
+        # While ErrorRollOver is reported, the key slots are not used.
+        rolled_over = self._pressed_count > _MAX_KEYPRESSES
+        pressed_keys[keycode >> 3] ^= bit
+        self._pressed_count -= 1
+        slot = self._key_slots[keycode]
+        if slot:
+            self._key_slots[keycode] = 0
+            self._free_slots |= 1 << (slot - 1)
+            self._unorder_slot(slot - 1)
+            if not rolled_over:
+                self.report_keys[slot - 1] = 0
+        if rolled_over and self._pressed_count == _MAX_KEYPRESSES:
+            # Few enough keys are left to report them again.
+            self._reassign_slots()
+
+    def _reassign_slots(self) -> None:
+        """Give every pressed key a slot in the report, after an ErrorRollOver."""
+        pressed_keys = self._pressed_keys
+        key_slots = self._key_slots
+        report_keys = self.report_keys
+        slot = 0
+        for keycode in range(256):
+            key_slots[keycode] = 0
+            if pressed_keys[keycode >> 3] & (1 << (keycode & 7)):
+                report_keys[slot] = keycode
+                self._slot_order[slot] = slot
+                slot += 1
+                key_slots[keycode] = slot
+        for i in range(slot, _MAX_KEYPRESSES):
+            report_keys[i] = 0
+        self._free_slots = 0x3F & ~((1 << slot) - 1)
+        self._ordered = slot
+
+    def _unorder_slot(self, slot: int) -> None:
+        """Remove a slot freed by a key release from the order of the keys pressed."""
+        order = self._slot_order
+        count = self._ordered - 1
+        i = 0
+        while order[i] != slot:
+            i += 1
+        while i < count:
+            order[i] = order[i + 1]
+            i += 1
+        self._ordered = count
+
+    def _forget_keys(self) -> None:
+        """Forget the regular keys pressed, before the report is overwritten.
+        They are tracked again from the new report by the next press or release."""
+        if self._keys_stale or self._nkro:
+            return
+        self._keys_stale = True
+        pressed_keys = self._pressed_keys
+        key_slots = self._key_slots
+        if self._pressed_count > _MAX_KEYPRESSES:
+            # Some keys pressed have no slot.
+            for keycode in range(256):
+                key_slots[keycode] = 0
+            for i in range(32):
+                pressed_keys[i] = 0
+        elif self._pressed_count:
+            for keycode in self.report_keys:
+                key_slots[keycode] = 0
+                pressed_keys[keycode >> 3] &= 0xFF ^ (1 << (keycode & 7))
+        self._pressed_count = 0
+        self._free_slots = 0x3F
+        self._ordered = 0
+
+    def _track_keys(self) -> None:
+        """Track the regular keys in the report, after it was overwritten."""
+        self._keys_stale = False
+        report_keys = self.report_keys
+        for slot in range(_MAX_KEYPRESSES):
+            keycode = report_keys[slot]
+            if keycode:
+                self._pressed_keys[keycode >> 3] |= 1 << (keycode & 7)
+                self._pressed_count += 1
+                self._key_slots[keycode] = slot + 1
+                self._free_slots &= 0x3F ^ (1 << slot)
+                self._slot_order[self._ordered] = slot
+                self._ordered += 1
 
     @property
     def led_status(self) -> bytes:
         """Returns the last received report"""
+        self.update()
+        return self._led_status
+
+    def update(self) -> bool:
+        """Read the LED report sent by the host, and call the functions added with
+        `add_led_callback` if the LEDs changed. Call this regularly, for instance from the
+        main loop, when LED callbacks are used.
+
+        :returns: True if the LEDs changed.
+        """
         # get_last_received_report() returns None when nothing was received
         led_report = self._keyboard_device.get_last_received_report()
-        if led_report is not None:
-            self._led_status = led_report
-        return self._led_status
+        if led_report is None or led_report == self._led_status:
+            return False
+        self._led_status = led_report
+        leds = led_report[0]
+        for callback in self._led_callbacks:
+            callback(leds)
+        return True
+
+    def add_led_callback(self, callback: Callable[[int], None]) -> None:
+        """Call the given function whenever the host changes the keyboard LEDs.
+
+        :param callback: A function taking the new LED bits, to test against
+          ``LED_NUM_LOCK``, ``LED_CAPS_LOCK``, etc. It is called from `update`.
+
+        Example::
+
+            def mirror_caps_lock(leds):
+                led.value = bool(leds & Keyboard.LED_CAPS_LOCK)
+
+            kbd.add_led_callback(mirror_caps_lock)
+            while True:
+                kbd.update()
+        """
+        self._led_callbacks.append(callback)
+
+    def remove_led_callback(self, callback: Callable[[int], None]) -> None:
+        """Stop calling a function added with `add_led_callback`."""
+        self._led_callbacks.remove(callback)
 
     def led_on(self, led_code: int) -> bool:
         """Returns whether an LED is on based on the led code
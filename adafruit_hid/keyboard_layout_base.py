@@ -11,7 +11,8 @@
 
 
 try:
-    from typing import Tuple
+    import io
+    from typing import Iterable, Iterator, Optional, Tuple, Union
     from .keyboard import Keyboard
 except ImportError:
     pass
@@ -21,6 +22,48 @@ from time import sleep
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_HID.git"
 
+# Bit set in a packed keystroke (see KeyboardLayoutBase._keystrokes) if altgr is required.
+_ALTGR_KEYSTROKE = 0x100
+
+# Keystrokes of each character of each layout class, built on first use by _descriptors().
+_descriptor_tables = {}
+# Inverse tables of each layout class, built on first use by _reverse_index().
+_reverse_indexes = {}
+
+
+def _read_chunks(stream, size: int) -> Iterator[Union[str, bytes]]:
+    """Read a stream until its end, ``size`` characters or bytes at a time."""
+    while True:
+        chunk = stream.read(size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _utf8_boundary(data: bytes) -> int:
+    """Return the length of the complete UTF-8 characters at the start of ``data``,
+    leaving out a character cut at the end."""
+    end = len(data)
+    # Skip back over continuation bytes to the start of the last character.
+    start = end - 1
+    while start >= 0 and end - start < 4 and data[start] & 0xC0 == 0x80:
+        start -= 1
+    if start < 0:
+        return end
+    lead = data[start]
+    if lead >= 0xF8:
+        # Never starts a character: keep it, so that decoding fails on it.
+        return end
+    if lead >= 0xF0:
+        length = 4
+    elif lead >= 0xE0:
+        length = 3
+    elif lead >= 0xC0:
+        length = 2
+    else:
+        return end
+    return start if end - start < length else end
+
 
 class KeyboardLayoutBase:
     """Base class for keyboard layouts. Uses the tables defined in the subclass
@@ -61,39 +104,55 @@ class KeyboardLayoutBase:
     ``KKK KKKK`` is the (low) ASCII code for the second character.
     """
 
-    def __init__(self, keyboard: Keyboard) -> None:
+    TYPING_SEQUENTIAL = 0
+    """Typing mode sending altgr, shift and the key in separate reports, then a release report,
+    for every character. This is the default and works with every host."""
+    TYPING_MINIMAL = 1
+    """Typing mode sending the modifiers and the key together in one report. Keys are released
+    only when the next character needs the same key or different modifiers, and at the end."""
+    TYPING_ROLLOVER = 2
+    """Typing mode packing runs of up to six characters typed with different keys and the
+    same modifiers into a single report, followed by a release report. Hosts handle the keys
+    of a report in slot order, so they see the characters in order. A run ends when the
+    next character needs a key already in the report, other modifiers, or a seventh key."""
+
+    def __init__(
+        self, keyboard: Keyboard, typing_mode: int = TYPING_SEQUENTIAL
+    ) -> None:
         """Specify the layout for the given keyboard.
 
         :param keyboard: a Keyboard object. Write characters to this keyboard when requested.
+        :param typing_mode: How characters are turned into reports, like `TYPING_MINIMAL`.
+          Defaults to `TYPING_SEQUENTIAL`. Can be changed later with ``typing_mode``.
 
         Example::
 
             kbd = Keyboard(usb_hid.devices)
             layout = KeyboardLayout(kbd)
+
+            # Send about half as many reports for mixed-case text
+            fast_layout = KeyboardLayout(kbd, KeyboardLayout.TYPING_MINIMAL)
         """
         self.keyboard = keyboard
+        self.typing_mode = typing_mode
 
-    def _write(self, keycode: int, altgr: bool = False) -> None:
-        """Type a key combination based on shift bit and altgr bool
+        # Modifier bits matching SHIFT_CODE and RIGHT_ALT_CODE in a keyboard report.
+        self._shift_bit = 1 << (self.SHIFT_CODE - 0xE0)
+        self._altgr_bit = 1 << (self.RIGHT_ALT_CODE - 0xE0)
 
-        :param keycode: int value of the keycode, with the shift bit.
-        :param altgr: bool indicating if the altgr key should be pressed too.
-        """
-        # Add altgr modifier if needed
-        if altgr:
-            self.keyboard.press(self.RIGHT_ALT_CODE)
-        # If this is a shifted char, clear the SHIFT flag and press the SHIFT key.
-        if keycode & self.SHIFT_FLAG:
-            keycode &= ~self.SHIFT_FLAG
-            self.keyboard.press(self.SHIFT_CODE)
-        self.keyboard.press(keycode)
-        self.keyboard.release_all()
+        # Scratch 8-byte keyboard report holding the keys pressed while typing,
+        # and whether it holds keys not sent yet (TYPING_ROLLOVER).
+        self._report = bytearray(8)
+        self._unsent = False
+        # Packed keystrokes of each character, shared by all instances of the class.
+        self._descriptor_table = self._descriptors()
 
     def write(self, string: str, delay: float = None) -> None:
         """Type the string by pressing and releasing keys on my keyboard.
 
         :param string: A string of UTF-8 characters to convert to key presses and send.
         :param float delay: Optional delay in seconds between key presses.
+          With a delay, keys are always released before pausing, whatever the `typing_mode`.
         :raises ValueError: if any of the characters has no keycode
             (such as some control characters).
 
@@ -102,31 +161,216 @@ class KeyboardLayoutBase:
             # Write abc followed by Enter to the keyboard
             layout.write('abc\\n')
         """
+        emit = self.keyboard.send_reports
+        self._hold_modifiers()
+        try:
+            self._type_text(string, emit, delay)
+        finally:
+            self._release_keystroke(emit)
+
+    def write_stream(
+        self,
+        source: Union[Iterable[Union[str, bytes]], io.IOBase],
+        delay: float = None,
+        chunk_size: int = 256,
+    ) -> None:
+        """Type text read piece by piece, without holding all of it in memory.
+
+        Keys left pressed by the `typing_mode` at the end of a chunk stay pressed into
+        the next one, so the reports are the same as with `write` for the whole text.
+
+        :param source: A text or binary stream with a ``read()`` method, such as an open
+          file, or an iterable of strings or of UTF-8 encoded bytes. A character may be
+          split across two bytes chunks.
+        :param float delay: Optional delay in seconds between key presses.
+        :param chunk_size: Number of characters or bytes read from a stream at once.
+        :raises ValueError: if any of the characters has no keycode, or if the bytes are
+          not valid UTF-8.
+
+        Example::
+
+            # Type a large file
+            with open('notes.txt', 'rb') as file:
+                layout.write_stream(file)
+        """
+        emit = self.keyboard.send_reports
+        if hasattr(source, "read"):
+            source = _read_chunks(source, chunk_size)
+        pending = b""
+        self._hold_modifiers()
+        try:
+            for chunk in source:
+                if not isinstance(chunk, str):
+                    if pending:
+                        chunk = pending + bytes(chunk)
+                    end = _utf8_boundary(chunk)
+                    pending = bytes(chunk[end:])
+                    chunk = str(chunk[:end], "utf-8")
+                self._type_text(chunk, emit, delay)
+            if pending:
+                raise ValueError("Incomplete UTF-8 character at the end of the text.")
+        finally:
+            self._release_keystroke(emit)
+
+    def _hold_modifiers(self) -> None:
+        """Start typing with the modifiers held on the keyboard, like ``Keyboard.press``
+        would, so that ``layout.write('a')`` after ``kbd.press(Keycode.CONTROL)`` sends
+        control+A. `TYPING_SEQUENTIAL` keeps them for the first key typed; the other
+        modes replace them with the modifiers each character needs."""
+        self._report[0] = self.keyboard.report[0]
+
+    def _type_text(self, string: str, emit, delay: float) -> None:
+        """Type each character of the string, leaving the last keys pressed."""
         for char in string:
-            # find easy ones first
-            keycode = self._char_to_keycode(char)
-            if keycode > 0:
-                self._write(keycode, char in self.NEED_ALTGR)
-            # find combined keys
-            elif ord(char) in self.COMBINED_KEYS:
-                # first key (including shift bit)
-                cchar = self.COMBINED_KEYS[ord(char)]
-                self._write(cchar >> 8, cchar & self.ALTGR_FLAG)
-                # second key (removing the altgr bit)
-                char = chr(cchar & 0xFF & (~self.ALTGR_FLAG))
-                keycode = self._char_to_keycode(char)
-                # assume no altgr needed for second key
-                self._write(keycode, False)
-            else:
-                raise ValueError(
-                    "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
-                        letter=repr(char), num=ord(char)
-                    )
-                )
+            self._type_char(char, emit)
 
             if delay is not None:
+                self._release_keystroke(emit)
                 sleep(delay)
 
+    def compile(self, string: str) -> bytearray:
+        """Convert the string once into the keyboard reports that type it.
+
+        The result is a flat buffer of 8-byte keyboard reports, the same ones `write`
+        would send in the current `typing_mode`. It can be replayed as often as needed
+        with `write_compiled` without looking up any character again.
+
+        :param string: A string of UTF-8 characters to convert to keyboard reports.
+        :returns: bytearray whose length is a multiple of 8.
+        :raises ValueError: if any of the characters has no keycode
+            (such as some control characters).
+
+        Example::
+
+            # Convert the macro once, then type it whenever needed
+            macro = layout.compile('SELECT * FROM users;\\n')
+            layout.write_compiled(macro)
+        """
+        reports = bytearray()
+        emit = reports.extend
+        try:
+            for char in string:
+                self._type_char(char, emit)
+        finally:
+            self._release_keystroke(emit)
+        return reports
+
+    def write_compiled(self, reports: bytes, delay: float = None) -> None:
+        """Send keyboard reports previously returned by `compile` to my keyboard.
+
+        :param reports: A buffer of 8-byte keyboard reports.
+        :param float delay: Optional delay in seconds after each report.
+        """
+        if delay is None:
+            self.keyboard.send_reports(reports)
+            return
+        view = memoryview(reports)
+        for start in range(0, len(view), 8):
+            self.keyboard.send_reports(view[start : start + 8])
+            sleep(delay)
+
+    def _type_char(self, char: str, emit) -> None:
+        """Type one character, passing each report to send to ``emit``.
+
+        Keys may be left pressed when the `typing_mode` allows it:
+        call `_release_keystroke` once done.
+        """
+        keystrokes = self._keystrokes(char)
+        if keystrokes >> 16:
+            self._type_keystroke(keystrokes >> 16, emit)
+        self._type_keystroke(keystrokes & 0xFFFF, emit)
+
+    def _type_keystroke(self, keystroke: int, emit) -> None:
+        """Update the scratch report to type one packed keystroke,
+        passing each report to send to ``emit``.
+
+        Keys may be left pressed when the `typing_mode` allows it:
+        call `_release_keystroke` once done.
+        """
+        report = self._report
+        # Keycode without the SHIFT_FLAG.
+        keycode = keystroke & 0x7F
+        typing_mode = self.typing_mode
+        if typing_mode != self.TYPING_SEQUENTIAL:
+            modifier = 0
+            if keystroke & _ALTGR_KEYSTROKE:
+                modifier = self._altgr_bit
+            if keystroke & self.SHIFT_FLAG:
+                modifier |= self._shift_bit
+            slot = 2
+            if typing_mode == self.TYPING_ROLLOVER:
+                # Find the first free slot, stopping early if the key is already pressed.
+                while slot < 8 and report[slot] and report[slot] != keycode:
+                    slot += 1
+                if slot == 8 or report[slot] or report[0] != modifier:
+                    self._release_keystroke(emit)
+                    slot = 2
+                # The report is sent once the run of keys ends.
+                report[0] = modifier
+                report[slot] = keycode
+                self._unsent = True
+                return
+            # TYPING_MINIMAL: a new key with the same modifiers replaces the previous one.
+            if report[2] and (report[0] != modifier or report[2] == keycode):
+                self._release_keystroke(emit)
+            report[0] = modifier
+            report[slot] = keycode
+            emit(report)
+            return
+
+        # TYPING_SEQUENTIAL: press altgr and shift in their own reports before the key
+        # itself, then release everything.
+        if keystroke & _ALTGR_KEYSTROKE:
+            report[0] |= self._altgr_bit
+            emit(report)
+        if keystroke & self.SHIFT_FLAG:
+            report[0] |= self._shift_bit
+            emit(report)
+        report[2] = keycode
+        emit(report)
+        report[0] = report[2] = 0
+        emit(report)
+
+    def _release_keystroke(self, emit) -> None:
+        """Send any keys left unsent by `_type_keystroke`, then release them."""
+        report = self._report
+        if report[2]:
+            if self._unsent:
+                self._unsent = False
+                emit(report)
+            # A while loop: a range would be allocated on each release.
+            i = 0
+            while i < 8:
+                report[i] = 0
+                i += 1
+            emit(report)
+        else:
+            report[0] = 0
+
+    def _keystrokes(self, char: str) -> int:
+        """Return the keystrokes needed to type the character, packed into an int.
+
+        The low 16 bits hold the keystroke for the character. For characters typed
+        with a dead key, the bits above hold the keystroke for the dead key, which
+        is typed first. Each keystroke is a keycode with the `SHIFT_FLAG` set if
+        needed, and bit 0x100 set if altgr is needed.
+
+        :raises ValueError: if there is no keycode for ``char``.
+        """
+        keystrokes = self._descriptor_table.get(ord(char))
+        if keystrokes is None:
+            raise self._no_keycode(char)
+        return keystrokes
+
+    @staticmethod
+    def _no_keycode(char: str) -> ValueError:
+        """The error raised when there is no keycode for ``char``."""
+        return ValueError(
+            "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
+                letter=repr(char), num=ord(char)
+            )
+        )
+
     def keycodes(self, char: str) -> Tuple[int, ...]:
         """Return a tuple of keycodes needed to type the given character.
 
@@ -146,17 +390,15 @@ class KeyboardLayoutBase:
             # Raises ValueError with a US layout because it's an unknown character
             keycode('é')
         """
-        keycode = self._char_to_keycode(char)
-        if keycode == 0:
-            raise ValueError(
-                "No keycode available for character {letter} ({num}/0x{num:02x}).".format(
-                    letter=repr(char), num=ord(char)
-                )
-            )
+        keycode = self._keystrokes(char)
+        if keycode >> 16:
+            # Typed with a dead key: there is no single key combination.
+            raise self._no_keycode(char)
 
         codes = []
-        if char in self.NEED_ALTGR:
+        if keycode & _ALTGR_KEYSTROKE:
             codes.append(self.RIGHT_ALT_CODE)
+            keycode &= 0xFF
         if keycode & self.SHIFT_FLAG:
             codes.extend((self.SHIFT_CODE, keycode & ~self.SHIFT_FLAG))
         else:
@@ -164,28 +406,169 @@ class KeyboardLayoutBase:
 
         return codes
 
-    def _above128char_to_keycode(self, char: str) -> int:
-        """Return keycode for above 128 utf8 codes.
+    def keycodes_into(self, char: str, buffer: bytearray) -> int:
+        """Write the keycodes needed to type the given character into ``buffer``, like
+        `keycodes`, without allocating memory.
+
+        :param char: A single UTF8 character in a string.
+        :param buffer: Where to write the keycodes. Up to three are needed: altgr,
+          shift and the key itself.
+        :returns: the number of keycodes written.
+        :raises ValueError: if there is no keycode for ``char``.
 
-        A character can be indexed by the char itself or its int ord() value.
+        Example::
 
-        :param char_val: char value
-        :return: keycode, with modifiers if needed
+            codes = bytearray(3)
+            count = layout.keycodes_into('A', codes)
+            for i in range(count):
+                kbd.press_key(codes[i])
+            kbd.release_all()
         """
-        if ord(char) in self.HIGHER_ASCII:
-            return self.HIGHER_ASCII[ord(char)]
-        if char in self.HIGHER_ASCII:
-            return self.HIGHER_ASCII[char]
+        keycode = self._keystrokes(char)
+        if keycode >> 16:
+            raise self._no_keycode(char)
+
+        count = 0
+        if keycode & _ALTGR_KEYSTROKE:
+            buffer[0] = self.RIGHT_ALT_CODE
+            count = 1
+            keycode &= 0xFF
+        if keycode & self.SHIFT_FLAG:
+            buffer[count] = self.SHIFT_CODE
+            count += 1
+            keycode &= ~self.SHIFT_FLAG
+        buffer[count] = keycode
+        return count + 1
+
+    @classmethod
+    def dead_key(cls, keycode: int, modifier: int = 0) -> int:
+        """Return a non-zero value if the key is a dead key in this layout, to pass to
+        `keycode_to_char` with the next key. Otherwise return 0.
+
+        :param keycode: The keycode of the key pressed.
+        :param modifier: The modifier byte of the keyboard report.
+        """
+        keystroke = cls._report_keystroke(keycode, modifier)
+        if keystroke in cls._reverse_index()[2]:
+            return keystroke
         return 0
 
-    def _char_to_keycode(self, char: str) -> int:
-        """Return the HID keycode for the given character, with the SHIFT_FLAG possibly set.
+    @classmethod
+    def keycode_to_char(
+        cls, keycode: int, modifier: int = 0, dead_key: int = 0
+    ) -> Optional[str]:
+        """Return the character typed by a key with this layout, or None if there is none.
+
+        :param keycode: The keycode of the key pressed.
+        :param modifier: The modifier byte of the keyboard report. Keys pressed with
+          control, left alt or GUI do not type characters.
+        :param dead_key: The value returned by `dead_key` for the previous key, if it
+          was a dead key, to get the combined character.
 
-        If the character requires pressing the Shift key, the SHIFT_FLAG bit is set.
-        You must clear this bit before passing the keycode in a USB report.
+        Examples::
+
+            # Returns 'A'
+            layout.keycode_to_char(Keycode.A, Keycode.modifier_bit(Keycode.SHIFT))
+            # Returns None
+            layout.keycode_to_char(Keycode.A, Keycode.modifier_bit(Keycode.CONTROL))
         """
-        char_val = ord(char)
-        if char_val > len(self.ASCII_TO_KEYCODE):
-            return self._above128char_to_keycode(char)
-        keycode = self.ASCII_TO_KEYCODE[char_val]
+        keystroke = cls._report_keystroke(keycode, modifier)
+        if keystroke < 0:
+            return None
+        if dead_key:
+            return cls._reverse_index()[1].get(dead_key << 16 | keystroke)
+        return cls._reverse_index()[0].get(keystroke)
+
+    @classmethod
+    def _report_keystroke(cls, keycode: int, modifier: int) -> int:
+        """Return the packed keystroke for a key and modifier byte of a keyboard report,
+        or -1 if the layout tables cannot hold it."""
+        # Left and right shift, and altgr.
+        shift_bits = 0x11 << (cls.SHIFT_CODE - 0xE0)
+        altgr_bit = 1 << (cls.RIGHT_ALT_CODE - 0xE0)
+        # Any other modifier makes a shortcut, not a character.
+        if keycode >= cls.SHIFT_FLAG or modifier & ~(shift_bits | altgr_bit):
+            return -1
+        if modifier & shift_bits:
+            keycode |= cls.SHIFT_FLAG
+        if modifier & altgr_bit:
+            keycode |= _ALTGR_KEYSTROKE
         return keycode
+
+    @classmethod
+    def _descriptors(cls) -> dict:
+        """Return the packed keystrokes (see `_keystrokes`) of each character the layout
+        can type, indexed by ord() value, built on first use for each class."""
+        table = _descriptor_tables.get(cls)
+        if table is not None:
+            return table
+        table = {}
+        # Characters typed with a dead key, unless they have their own keycode below.
+        for code, cchar in cls.COMBINED_KEYS.items():
+            dead = cchar >> 8
+            if cchar & cls.ALTGR_FLAG:
+                dead |= _ALTGR_KEYSTROKE
+            # assume no altgr needed for second key
+            table[code] = (
+                dead << 16 | cls.ASCII_TO_KEYCODE[cchar & 0xFF & ~cls.ALTGR_FLAG]
+            )
+        low = len(cls.ASCII_TO_KEYCODE)
+        keycodes = list(enumerate(cls.ASCII_TO_KEYCODE))
+        # Characters indexed by their ord() value take precedence.
+        for key, keycode in cls.HIGHER_ASCII.items():
+            if not isinstance(key, int):
+                key = ord(key)
+                if key in cls.HIGHER_ASCII:
+                    continue
+            if key >= low:
+                keycodes.append((key, keycode))
+        for code, keycode in keycodes:
+            if keycode:
+                if chr(code) in cls.NEED_ALTGR:
+                    keycode |= _ALTGR_KEYSTROKE
+                table[code] = keycode
+        _descriptor_tables[cls] = table
+        return table
+
+    @classmethod
+    def _reverse_index(cls) -> Tuple[dict, dict, set]:
+        """Return the inverse tables of the layout, built on first use for each class:
+        the character typed by each packed keystroke, the character typed by each dead
+        keystroke (shifted 16 bits left) followed by a keystroke, and the dead keystrokes.
+
+        When several characters use the same keystroke, the lowest one is kept.
+        """
+        index = _reverse_indexes.get(cls)
+        if index is not None:
+            return index
+        chars = {}
+        combined = {}
+        dead_keys = set()
+        for code, keycode in enumerate(cls.ASCII_TO_KEYCODE):
+            if keycode:
+                char = chr(code)
+                if char in cls.NEED_ALTGR:
+                    keycode |= _ALTGR_KEYSTROKE
+                if keycode not in chars:
+                    chars[keycode] = char
+        for key, keycode in sorted(
+            cls.HIGHER_ASCII.items(),
+            key=lambda item: item[0] if isinstance(item[0], int) else ord(item[0]),
+        ):
+            char = chr(key) if isinstance(key, int) else key
+            if char in cls.NEED_ALTGR:
+                keycode |= _ALTGR_KEYSTROKE
+            if keycode not in chars:
+                chars[keycode] = char
+        for code, cchar in sorted(cls.COMBINED_KEYS.items()):
+            dead = cchar >> 8
+            if cchar & cls.ALTGR_FLAG:
+                dead |= _ALTGR_KEYSTROKE
+            # Same as _keystrokes(): no altgr for the second key.
+            second = cls.ASCII_TO_KEYCODE[cchar & 0xFF & ~cls.ALTGR_FLAG]
+            dead_keys.add(dead)
+            if dead << 16 | second not in combined:
+                combined[dead << 16 | second] = chr(code)
+        index = (chars, combined, dead_keys)
+        _reverse_indexes[cls] = index
+        return index
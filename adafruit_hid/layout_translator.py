@@ -0,0 +1,275 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.layout_translator.LayoutTranslator`
+====================================================
+
+* Author(s): quaxalber
+"""
+
+from .keyboard_layout_base import _ALTGR_KEYSTROKE, KeyboardLayoutBase
+
+try:
+    from typing import Callable, Tuple, Type
+except ImportError:
+    pass
+
+# Translation tables of each (source, target) pair of layout classes.
+_translation_tables = {}
+
+
+# pylint: disable=too-many-instance-attributes
+class LayoutTranslator:
+    """Translate keyboard reports typed with one layout into the reports typing the same
+    characters with another layout.
+
+    Keys typing a character in the source layout are replaced by the keys typing that
+    character in the target layout, with shift and altgr as needed, and dead keys on
+    either side. Keys typing no character, like arrows or function keys, are passed
+    through unchanged, as are control, left alt and GUI. Characters missing from the
+    target layout are dropped.
+
+    Each key press costs one lookup in a table built once per pair of layouts.
+    """
+
+    def __init__(
+        self,
+        source: Type[KeyboardLayoutBase],
+        target: Type[KeyboardLayoutBase],
+    ) -> None:
+        """Create a translator between two layout classes.
+
+        :param source: The layout class of the keyboard sending the reports.
+        :param target: The layout class the host expects.
+
+        Example::
+
+            translator = LayoutTranslator(KeyboardLayoutFR, KeyboardLayoutUS)
+            kbd = Keyboard(usb_hid.devices)
+            while True:
+                report = read_source_report()
+                translator.translate(report, kbd.send_reports)
+        """
+        self.source = source
+        self.target = target
+        self._table, self._combined = self._tables(source, target)
+        self._dead_keys = source._reverse_index()[2]  # pylint: disable=protected-access
+
+        # Modifier bits for shift (left and right) and altgr in each layout.
+        self._source_bits = 0x11 << (source.SHIFT_CODE - 0xE0) | 1 << (
+            source.RIGHT_ALT_CODE - 0xE0
+        )
+        self._target_shift = 1 << (target.SHIFT_CODE - 0xE0)
+        self._target_altgr = 1 << (target.RIGHT_ALT_CODE - 0xE0)
+
+        # Last report received, and the report sent to the host.
+        self._previous = bytearray(8)
+        self._output = bytearray(8)
+        # Keycode sent for each source keycode held, 0 if it was dropped,
+        # and whether it is a translation rather than the key passed through.
+        self._sent_keycodes = bytearray(256)
+        self._sent_translated = bytearray(256)
+        # Source keys held that were translated, and the modifiers their translation needs.
+        self._translated = 0
+        self._translated_modifier = 0
+        # Dead keystroke pressed in the source layout, waiting for the next key.
+        self._dead_key = 0
+        # Keycodes released from the output by the current translate() call and not yet
+        # sent to the host.
+        self._released = bytearray(6)
+        self._released_count = 0
+
+    def reset(self) -> None:
+        """Forget the keys held and any pending dead key."""
+        for i in range(8):
+            self._previous[i] = 0
+            self._output[i] = 0
+        for i in range(256):
+            self._sent_keycodes[i] = 0
+            self._sent_translated[i] = 0
+        self._translated = 0
+        self._translated_modifier = 0
+        self._dead_key = 0
+        self._released_count = 0
+
+    def translate(self, report: bytes, emit: Callable[[bytearray], None]) -> None:
+        """Translate one 8-byte boot keyboard report from the source keyboard.
+
+        :param report: The report received from the source keyboard.
+        :param emit: Function called with each report to send to the host, such as
+          `Keyboard.send_reports`. A key press may need several reports, for instance
+          to type a dead key, or none at all.
+        """
+        previous = self._previous
+        output = self._output
+        modifier = report[0]
+        changed = False
+        self._released_count = 0
+        for i in range(2, 8):
+            keycode = previous[i]
+            if keycode and not _holds(report, keycode):
+                changed |= self._release(keycode)
+        for i in range(2, 8):
+            keycode = report[i]
+            if keycode and not _holds(previous, keycode):
+                changed |= self._press(keycode, modifier, emit)
+        output_modifier = self._output_modifier(modifier)
+        if changed or output[0] != output_modifier:
+            output[0] = output_modifier
+            emit(output)
+        for i in range(8):
+            previous[i] = report[i]
+
+    def _output_modifier(self, modifier: int) -> int:
+        """The modifier byte to send while ``modifier`` is held on the source keyboard."""
+        if self._translated:
+            return modifier & ~self._source_bits | self._translated_modifier
+        return modifier
+
+    def _press(self, keycode: int, modifier: int, emit) -> bool:
+        """Send the translation of a key pressed on the source keyboard.
+
+        :returns: True if the report to the host changed and still has to be sent.
+        """
+        # pylint: disable=protected-access
+        keystroke = self.source._report_keystroke(keycode, modifier & self._source_bits)
+        translation = None
+        if self._dead_key:
+            translation = self._combined.get(self._dead_key << 16 | keystroke)
+            self._dead_key = 0
+        if translation is None:
+            if keystroke in self._dead_keys:
+                # Wait for the next key to know the character.
+                self._dead_key = keystroke
+                self._sent_keycodes[keycode] = 0
+                return False
+            translation = self._table.get(keystroke)
+        if translation is None:
+            # No character: pass the key through.
+            self._press_again(keycode, emit)
+            self._add_key(keycode)
+            self._sent_keycodes[keycode] = keycode
+            return True
+        if not translation:
+            # No way to type the character with the target layout.
+            self._sent_keycodes[keycode] = 0
+            return False
+
+        output = self._output
+        passthrough = modifier & ~self._source_bits
+        if translation >> 16:
+            # Tap the dead key first.
+            dead = translation >> 16
+            self._press_again(dead & 0x7F, emit)
+            output[0] = passthrough | self._keystroke_modifier(dead)
+            slot = self._add_key(dead & 0x7F)
+            emit(output)
+            output[slot] = 0
+            emit(output)
+        self._press_again(translation & 0x7F, emit)
+        self._translated += 1
+        self._translated_modifier = self._keystroke_modifier(translation)
+        output[0] = passthrough | self._translated_modifier
+        self._add_key(translation & 0x7F)
+        self._sent_keycodes[keycode] = translation & 0x7F
+        self._sent_translated[keycode] = 1
+        emit(output)
+        return False
+
+    def _release(self, keycode: int) -> bool:
+        """Release the translation of a key released on the source keyboard.
+
+        :returns: True if the report to the host changed.
+        """
+        sent = self._sent_keycodes[keycode]
+        if not sent:
+            return False
+        self._sent_keycodes[keycode] = 0
+        if self._sent_translated[keycode]:
+            self._sent_translated[keycode] = 0
+            self._translated -= 1
+        output = self._output
+        for i in range(2, 8):
+            if output[i] == sent:
+                output[i] = 0
+                if self._released_count < 6:
+                    self._released[self._released_count] = sent
+                    self._released_count += 1
+                return True
+        return False
+
+    def _press_again(self, keycode: int, emit) -> None:
+        """Before adding a key to the output report, send a report without it if it is
+        held, for another source key, or if its release is not sent yet. Otherwise the
+        host would not see a new press, and the character would be lost."""
+        output = self._output
+        held = False
+        for i in range(2, 8):
+            if output[i] == keycode:
+                output[i] = 0
+                held = True
+        if not held:
+            released = self._released
+            i = 0
+            while i < self._released_count and released[i] != keycode:
+                i += 1
+            if i == self._released_count:
+                return
+        emit(output)
+        # Every pending release has now been sent.
+        self._released_count = 0
+
+    def _add_key(self, keycode: int) -> int:
+        """Add a key to the output report and return its slot."""
+        output = self._output
+        for i in range(2, 8):
+            if output[i] == keycode or not output[i]:
+                output[i] = keycode
+                return i
+        # All slots are used: replace the oldest key.
+        for i in range(2, 7):
+            output[i] = output[i + 1]
+        output[7] = keycode
+        return 7
+
+    def _keystroke_modifier(self, keystroke: int) -> int:
+        modifier = 0
+        if keystroke & KeyboardLayoutBase.SHIFT_FLAG:
+            modifier = self._target_shift
+        if keystroke & _ALTGR_KEYSTROKE:
+            modifier |= self._target_altgr
+        return modifier
+
+    @staticmethod
+    def _tables(
+        source: Type[KeyboardLayoutBase], target: Type[KeyboardLayoutBase]
+    ) -> Tuple[dict, dict]:
+        """Return the tables translating source keystrokes into target keystrokes, built on
+        first use for each pair of layouts: one for single keystrokes, one for a dead
+        keystroke (shifted 16 bits left) followed by a keystroke.
+        Keystrokes typing characters missing from the target layout map to 0."""
+        tables = _translation_tables.get((source, target))
+        if tables is not None:
+            return tables
+        # pylint: disable=protected-access
+        chars, combined_chars, _ = source._reverse_index()
+        target_table = target._descriptors()
+        table = {}
+        for keystroke, char in chars.items():
+            table[keystroke] = target_table.get(ord(char), 0)
+        combined = {}
+        for keystrokes, char in combined_chars.items():
+            combined[keystrokes] = target_table.get(ord(char), 0)
+        tables = (table, combined)
+        _translation_tables[(source, target)] = tables
+        return tables
+
+
+def _holds(report: bytes, keycode: int) -> bool:
+    """Return whether the keycode is in the key slots of the report."""
+    for i in range(2, 8):
+        if report[i] == keycode:
+            return True
+    return False
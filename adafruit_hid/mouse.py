@@ -8,15 +8,18 @@
 
 * Author(s): Dan Halbert
 """
+import time
+
 from . import find_device
 
 try:
-    from typing import Sequence
+    from typing import Sequence, Optional
     import usb_hid
 except ImportError:
     pass
 
 
+# pylint: disable=too-many-instance-attributes
 class Mouse:
     """Send USB HID mouse reports."""
 
@@ -31,11 +34,65 @@ class Mouse:
     FORWARD_BUTTON = 16
     """Forward mouse button."""
 
-    def __init__(self, devices: Sequence[usb_hid.Device], timeout: int = None) -> None:
+    # fmt: off
+    EXTENDED_REPORT_DESCRIPTOR = bytes(
+        (
+            0x05, 0x01,        # Usage Page (Generic Desktop)
+            0x09, 0x02,        # Usage (Mouse)
+            0xA1, 0x01,        # Collection (Application)
+            0x09, 0x01,        #   Usage (Pointer)
+            0xA1, 0x00,        #   Collection (Physical)
+            0x05, 0x09,        #     Usage Page (Button)
+            0x19, 0x01,        #     Usage Minimum (Button 1)
+            0x29, 0x08,        #     Usage Maximum (Button 8)
+            0x15, 0x00,        #     Logical Minimum (0)
+            0x25, 0x01,        #     Logical Maximum (1)
+            0x95, 0x08,        #     Report Count (8)
+            0x75, 0x01,        #     Report Size (1)
+            0x81, 0x02,        #     Input (Data, Variable, Absolute)
+            0x05, 0x01,        #     Usage Page (Generic Desktop)
+            0x09, 0x30,        #     Usage (X)
+            0x09, 0x31,        #     Usage (Y)
+            0x16, 0x01, 0x80,  #     Logical Minimum (-32767)
+            0x26, 0xFF, 0x7F,  #     Logical Maximum (32767)
+            0x75, 0x10,        #     Report Size (16)
+            0x95, 0x02,        #     Report Count (2)
+            0x81, 0x06,        #     Input (Data, Variable, Relative)
+            0x09, 0x38,        #     Usage (Wheel)
+            0x15, 0x81,        #     Logical Minimum (-127)
+            0x25, 0x7F,        #     Logical Maximum (127)
+            0x75, 0x08,        #     Report Size (8)
+            0x95, 0x01,        #     Report Count (1)
+            0x81, 0x06,        #     Input (Data, Variable, Relative)
+            0x05, 0x0C,        #     Usage Page (Consumer)
+            0x0A, 0x38, 0x02,  #     Usage (AC Pan)
+            0x95, 0x01,        #     Report Count (1)
+            0x81, 0x06,        #     Input (Data, Variable, Relative)
+            0xC0,              #   End Collection
+            0xC0,              # End Collection
+        )
+    )
+    # fmt: on
+    """Report descriptor for a mouse created with ``extended=True``: eight buttons,
+    16-bit x and y, an 8-bit wheel and an 8-bit horizontal pan, in a 7-byte report."""
+
+    def __init__(
+        self,
+        devices: Sequence[usb_hid.Device],
+        timeout: int = None,
+        flush_interval: Optional[float] = None,
+        extended: bool = False,
+    ) -> None:
         """Create a Mouse object that will send USB mouse HID reports.
 
         :param timeout: Time in seconds to wait for USB to become ready before timing out.
           Defaults to None to wait indefinitely.
+        :param flush_interval: Time in seconds between reports sent for motion added with
+          `accumulate`, usually the host poll interval. Defaults to None to send accumulated
+          motion only when `flush` is called.
+        :param extended: Send reports for a device using `EXTENDED_REPORT_DESCRIPTOR`,
+          with 16-bit x and y and a horizontal pan. Defaults to False for the
+          usual 4-byte mouse report.
 
         Devices can be a sequence of devices that includes a keyboard device or a keyboard device
         itself. A device is any object that implements ``send_report()``, ``usage_page`` and
@@ -50,7 +107,29 @@ class Mouse:
         # report[1] x movement
         # report[2] y movement
         # report[3] wheel movement
-        self.report = bytearray(4)
+        # Extended reports:
+        # report[0] buttons pressed (all eight MouseButton bits)
+        # report[1:3] x movement, little-endian
+        # report[3:5] y movement, little-endian
+        # report[5] wheel movement
+        # report[6] horizontal pan
+        self._extended = extended
+        self.report = bytearray(7 if extended else 4)
+        # Largest x and y movement in one report.
+        self._xy_limit = 32767 if extended else 127
+
+        self.flush_interval = flush_interval
+        # Motion added by accumulate() and not sent yet.
+        self._pending_x = 0
+        self._pending_y = 0
+        self._pending_wheel = 0
+        self._pending_pan = 0
+        # Fractional movement left over by move(), carried over to the next call.
+        self._residual_x = 0
+        self._residual_y = 0
+        self._residual_wheel = 0
+        self._residual_pan = 0
+        self._last_flush = time.monotonic()
 
     def __str__(self):
         return str(self._mouse_device)
@@ -59,7 +138,8 @@ class Mouse:
         """Press the given mouse buttons.
 
         :param buttons: a bitwise-or'd combination of ``LEFT_BUTTON``,
-            ``MIDDLE_BUTTON``, and ``RIGHT_BUTTON``.
+            ``MIDDLE_BUTTON``, and ``RIGHT_BUTTON``. An extended mouse supports all
+            eight `MouseButton` buttons.
 
         Examples::
 
@@ -68,7 +148,11 @@ class Mouse:
 
             # Press the left and right buttons simultaneously.
             m.press(Mouse.LEFT_BUTTON | Mouse.RIGHT_BUTTON)
+
+        Motion added with `accumulate` and not sent yet is sent first, so that the
+        button is pressed where the pointer is expected to be.
         """
+        self._flush_pending()
         self.report[0] |= buttons
         self._send_no_move()
 
@@ -77,12 +161,16 @@ class Mouse:
 
         :param buttons: a bitwise-or'd combination of ``LEFT_BUTTON``,
             ``MIDDLE_BUTTON``, and ``RIGHT_BUTTON``.
+
+        Motion added with `accumulate` and not sent yet is sent first, as in `press`.
         """
+        self._flush_pending()
         self.report[0] &= ~buttons
         self._send_no_move()
 
     def release_all(self) -> None:
         """Release all the mouse buttons."""
+        self._flush_pending()
         self.report[0] = 0
         self._send_no_move()
 
@@ -104,7 +192,9 @@ class Mouse:
         self.press(buttons)
         self.release(buttons)
 
-    def move(self, x: int = 0, y: int = 0, wheel: int = 0) -> None:
+    def move(
+        self, x: float = 0, y: float = 0, wheel: float = 0, pan: float = 0
+    ) -> None:
         """Move the mouse and turn the wheel as directed.
 
         :param x: Move the mouse along the x axis. Negative is to the left, positive
@@ -113,6 +203,16 @@ class Mouse:
             positive is downwards.
         :param wheel: Rotate the wheel this amount. Negative is toward the user, positive
             is away from the user. The scrolling effect depends on the host.
+        :param pan: Scroll horizontally this amount. Negative is to the left, positive
+            is to the right. Only available on an extended mouse.
+        :raises ValueError: if ``pan`` is used on a mouse that is not extended.
+
+        Movement too large for one report is split over several reports: more than 127
+        along x or y, or 32767 on an extended mouse.
+
+        Values may be floats, for instance after pointer acceleration or smoothing.
+        Only whole units are sent; the fractional part of each axis is kept and added
+        to the next call, so slow movements are not lost to rounding.
 
         Examples::
 
@@ -128,27 +228,136 @@ class Mouse:
 
             # Roll the mouse wheel away from the user.
             m.move(wheel=1)
+
+            # Move right by one unit every other call.
+            m.move(x=0.5)
         """
+        if pan and not self._extended:
+            raise ValueError("Horizontal pan requires an extended mouse.")
+        # Send whole units and carry the fractions over to the next call.
+        x += self._residual_x
+        y += self._residual_y
+        wheel += self._residual_wheel
+        pan += self._residual_pan
+        self._residual_x = x - int(x)
+        self._residual_y = y - int(y)
+        self._residual_wheel = wheel - int(wheel)
+        self._residual_pan = pan - int(pan)
+        x = int(x)
+        y = int(y)
+        wheel = int(wheel)
+        pan = int(pan)
+        xy_limit = self._xy_limit
         # Send multiple reports if necessary to move or scroll requested amounts.
-        while x != 0 or y != 0 or wheel != 0:
-            partial_x = self._limit(x)
-            partial_y = self._limit(y)
+        while x != 0 or y != 0 or wheel != 0 or pan != 0:
+            partial_x = self._limit(x, xy_limit)
+            partial_y = self._limit(y, xy_limit)
             partial_wheel = self._limit(wheel)
-            self.report[1] = partial_x & 0xFF
-            self.report[2] = partial_y & 0xFF
-            self.report[3] = partial_wheel & 0xFF
-            self._mouse_device.send_report(self.report)
+            partial_pan = self._limit(pan)
+            self._send_move(partial_x, partial_y, partial_wheel, partial_pan)
             x -= partial_x
             y -= partial_y
             wheel -= partial_wheel
+            pan -= partial_pan
+
+    def accumulate(
+        self, x: float = 0, y: float = 0, wheel: float = 0, pan: float = 0
+    ) -> None:
+        """Add motion to be sent later as a single report, instead of sending it right away.
+
+        :param x: Move the mouse along the x axis, as in `move`.
+        :param y: Move the mouse along the y axis, as in `move`.
+        :param wheel: Rotate the wheel this amount, as in `move`.
+        :param pan: Scroll horizontally this amount, as in `move`.
+        :raises ValueError: if ``pan`` is used on a mouse that is not extended.
+
+        The accumulated motion is sent by `flush`, which is called automatically once
+        ``flush_interval`` has elapsed since the previous flush.
+        Use this for input sources reporting faster than the host polls the mouse.
+
+        Example::
+
+            m = Mouse(usb_hid.devices, flush_interval=0.008)
+            while True:
+                dx, dy = read_sensor()
+                m.accumulate(dx, dy)
+        """
+        if pan and not self._extended:
+            raise ValueError("Horizontal pan requires an extended mouse.")
+        self._pending_x += x
+        self._pending_y += y
+        self._pending_wheel += wheel
+        self._pending_pan += pan
+        self.update()
+
+    def update(self) -> None:
+        """Send the accumulated motion if ``flush_interval`` has elapsed since the previous
+        flush. Call this regularly if motion may stop being accumulated for a while."""
+        if (
+            self.flush_interval is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Send one report with the motion accumulated so far.
+
+        Motion too large for one report is clamped, and only whole units are sent.
+        The rest is kept and sent by the next flush, so no motion is lost.
+        """
+        self._flush_report()
+
+    def _flush_pending(self) -> None:
+        """Send all the whole motion accumulated, in as many reports as needed."""
+        while self._flush_report():
+            pass
+
+    def _flush_report(self) -> bool:
+        """Send one report with the motion accumulated so far, as described in `flush`.
+
+        :returns: True if a report was sent, False if there was no whole motion to send.
+        """
+        self._last_flush = time.monotonic()
+        partial_x = self._limit(int(self._pending_x), self._xy_limit)
+        partial_y = self._limit(int(self._pending_y), self._xy_limit)
+        partial_wheel = self._limit(int(self._pending_wheel))
+        partial_pan = self._limit(int(self._pending_pan))
+        if (
+            partial_x == 0
+            and partial_y == 0
+            and partial_wheel == 0
+            and partial_pan == 0
+        ):
+            return False
+        self._send_move(partial_x, partial_y, partial_wheel, partial_pan)
+        self._pending_x -= partial_x
+        self._pending_y -= partial_y
+        self._pending_wheel -= partial_wheel
+        self._pending_pan -= partial_pan
+        return True
+
+    def _send_move(self, x: int, y: int, wheel: int, pan: int) -> None:
+        """Send a report with the given movement, already limited to the report range."""
+        report = self.report
+        report[1] = x & 0xFF
+        if self._extended:
+            report[2] = (x >> 8) & 0xFF
+            report[3] = y & 0xFF
+            report[4] = (y >> 8) & 0xFF
+            report[5] = wheel & 0xFF
+            report[6] = pan & 0xFF
+        else:
+            report[2] = y & 0xFF
+            report[3] = wheel & 0xFF
+        self._mouse_device.send_report(report)
 
     def _send_no_move(self) -> None:
         """Send a button-only report."""
-        self.report[1] = 0
-        self.report[2] = 0
-        self.report[3] = 0
-        self._mouse_device.send_report(self.report)
+        report = self.report
+        for i in range(1, len(report)):
+            report[i] = 0
+        self._mouse_device.send_report(report)
 
     @staticmethod
-    def _limit(dist: int) -> int:
-        return min(127, max(-127, dist))
+    def _limit(dist: int, limit: int = 127) -> int:
+        return min(limit, max(-limit, dist))
@@ -0,0 +1,196 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.packed_layout.PackedKeyboardLayout`
+====================================================
+
+* Author(s): quaxalber
+"""
+
+import io
+import sys
+from array import array
+
+from .keyboard_layout_base import _ALTGR_KEYSTROKE, KeyboardLayoutBase
+
+try:
+    from typing import Optional, Type, Union
+    from .keyboard import Keyboard
+except ImportError:
+    pass
+
+# File header: magic, format version, SHIFT_CODE, RIGHT_ALT_CODE, a reserved byte, then
+# the number of characters and the number of characters typed with a dead key, as 32-bit
+# little-endian ints. Then come the sorted code points (16-bit), the keystroke of each
+# character (a keycode with the SHIFT_FLAG, one byte), a bitmap of the characters typed
+# with altgr, and the side table of dead keys: the indices of the characters typed with a
+# dead key (16-bit) and their dead keystrokes (16-bit, with the altgr bit).
+_MAGIC = b"HIDL"
+_VERSION = 2
+_HEADER_LENGTH = 16
+
+
+def pack_layout(layout_class: Type[KeyboardLayoutBase]) -> bytes:
+    """Convert a layout class into the packed format read by `PackedKeyboardLayout`.
+
+    :param layout_class: The layout class, such as ``KeyboardLayoutUS``.
+    :returns: the packed layout, to save to a file.
+    :raises ValueError: if the layout types characters beyond U+FFFF.
+
+    Example::
+
+        # On a computer: convert the layout once.
+        with open("layout_fr.bin", "wb") as file:
+            file.write(pack_layout(KeyboardLayoutFR))
+    """
+    table = layout_class._descriptors()  # pylint: disable=protected-access
+    codes = sorted(table)
+    if codes and codes[-1] > 0xFFFF:
+        raise ValueError("Packed layouts only hold characters up to U+FFFF.")
+    code_array = array("H", codes)
+    keys = bytearray(len(codes))
+    altgr_bitmap = bytearray((len(codes) + 7) >> 3)
+    dead_indices = array("H")
+    dead_keystrokes = array("H")
+    for index, code in enumerate(codes):
+        keystrokes = table[code]
+        keys[index] = keystrokes & 0xFF
+        if keystrokes & _ALTGR_KEYSTROKE:
+            altgr_bitmap[index >> 3] |= 1 << (index & 7)
+        if keystrokes >> 16:
+            dead_indices.append(index)
+            dead_keystrokes.append(keystrokes >> 16)
+    if sys.byteorder == "big":
+        for values in (code_array, dead_indices, dead_keystrokes):
+            values.byteswap()
+
+    header = bytearray(_HEADER_LENGTH)
+    header[0:4] = _MAGIC
+    header[4] = _VERSION
+    header[5] = layout_class.SHIFT_CODE
+    header[6] = layout_class.RIGHT_ALT_CODE
+    header[8:12] = len(codes).to_bytes(4, "little")
+    header[12:16] = len(dead_indices).to_bytes(4, "little")
+    return b"".join(
+        (
+            header,
+            code_array.tobytes(),
+            keys,
+            altgr_bitmap,
+            dead_indices.tobytes(),
+            dead_keystrokes.tobytes(),
+        )
+    )
+
+
+class PackedKeyboardLayout(KeyboardLayoutBase):
+    """A keyboard layout loaded from the packed format made by `pack_layout`.
+
+    The layout is held in a few arrays: the sorted code points of the characters it can
+    type, one byte holding the keycode and shift of each of them, a bitmap of the
+    characters needing altgr, and a side table for the few characters typed with a dead
+    key, taking about 3 bytes per character. The arrays are read straight from the file,
+    without building dictionaries or importing a layout module, so several layouts can
+    stay loaded on boards with little RAM. Each character is found with a binary search.
+
+    The class methods looking up characters from keycodes, like `keycode_to_char`,
+    need the original layout class.
+    """
+
+    def __init__(
+        self,
+        keyboard: Keyboard,
+        layout: Union[str, bytes, io.IOBase],
+        typing_mode: int = KeyboardLayoutBase.TYPING_SEQUENTIAL,
+    ) -> None:
+        """Load a packed layout for the given keyboard.
+
+        :param keyboard: a Keyboard object. Write characters to this keyboard when requested.
+        :param layout: The path of a packed layout file, a binary file open for reading,
+          or the packed layout itself.
+        :param typing_mode: How characters are turned into reports, like `TYPING_MINIMAL`.
+        :raises ValueError: if ``layout`` is not a packed layout.
+
+        Example::
+
+            kbd = Keyboard(usb_hid.devices)
+            layout = PackedKeyboardLayout(kbd, "/layouts/layout_fr.bin")
+            layout.write("Bonjour à tous\\n")
+        """
+        if isinstance(layout, str):
+            with open(layout, "rb") as file:
+                self._load(file)
+        elif hasattr(layout, "readinto"):
+            self._load(layout)
+        else:
+            self._load(io.BytesIO(layout))
+        super().__init__(keyboard, typing_mode)
+
+    def _load(self, file) -> None:
+        """Read the arrays of a packed layout from a binary file."""
+        header = bytearray(_HEADER_LENGTH)
+        if (
+            file.readinto(header) != _HEADER_LENGTH
+            or header[0:4] != _MAGIC
+            or header[4] != _VERSION
+        ):
+            raise ValueError("Not a packed keyboard layout.")
+        # pylint: disable=invalid-name
+        self.SHIFT_CODE = header[5]
+        self.RIGHT_ALT_CODE = header[6]
+        count = int.from_bytes(header[8:12], "little")
+        dead_count = int.from_bytes(header[12:16], "little")
+
+        # Sized arrays to read into: a range does not need a temporary buffer.
+        self._codes = array("H", range(count))
+        self._keys = bytearray(count)
+        self._altgr_bitmap = bytearray((count + 7) >> 3)
+        self._dead_indices = array("H", range(dead_count))
+        self._dead_keystrokes = array("H", range(dead_count))
+        for table, length in (
+            (self._codes, 2 * count),
+            (self._keys, count),
+            (self._altgr_bitmap, len(self._altgr_bitmap)),
+            (self._dead_indices, 2 * dead_count),
+            (self._dead_keystrokes, 2 * dead_count),
+        ):
+            if file.readinto(table) != length:
+                raise ValueError("Truncated packed keyboard layout.")
+        if sys.byteorder == "big":
+            for table in (self._codes, self._dead_indices, self._dead_keystrokes):
+                table.byteswap()
+
+    def _keystrokes(self, char: str) -> int:
+        """Return the keystrokes needed to type the character, packed into an int.
+
+        :raises ValueError: if there is no keycode for ``char``.
+        """
+        code = ord(char)
+        index = _search(self._codes, code)
+        if index is None:
+            raise self._no_keycode(char)
+        keystrokes = self._keys[index]
+        if self._altgr_bitmap[index >> 3] & (1 << (index & 7)):
+            keystrokes |= _ALTGR_KEYSTROKE
+        dead = _search(self._dead_indices, index)
+        if dead is not None:
+            keystrokes |= self._dead_keystrokes[dead] << 16
+        return keystrokes
+
+
+def _search(values: array, value: int) -> Optional[int]:
+    """Return the index of the value in the sorted array, or None if it is missing."""
+    # Binary search: the bisect module is not available on CircuitPython.
+    low = 0
+    high = len(values)
+    while low < high:
+        middle = (low + high) >> 1
+        if values[middle] < value:
+            low = middle + 1
+        else:
+            high = middle
+    if low < len(values) and values[low] == value:
+        return low
+    return None
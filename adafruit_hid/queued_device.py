@@ -0,0 +1,267 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.queued_device.QueuedDevice`
+====================================================
+
+* Author(s): quaxalber
+"""
+
+import time
+
+from . import _DeviceWrapper
+
+try:
+    import threading
+except ImportError:
+    # CircuitPython has no threads: call QueuedDevice.process() instead.
+    threading = None
+
+try:
+    from typing import Optional
+except ImportError:
+    pass
+
+
+class _NoLock:
+    """Stand-in for `threading.Condition` when there is no background writer."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        pass
+
+    def notify_all(self):
+        """Nothing to notify without threads."""
+
+    def wait(self, timeout=None):
+        """Nothing to wait for without threads."""
+
+
+# pylint: disable=too-many-arguments, too-many-instance-attributes
+class QueuedDevice(_DeviceWrapper):
+    """Wrap a HID device so that sending a report never waits for the host.
+
+    Reports are copied into a bounded ring of preallocated slots, and sent to the wrapped
+    device in order by a background thread, or by `process` where there are no threads.
+    When the host stops polling (suspend, slow hub), the queue fills up and the
+    ``policy`` decides what happens to new reports. A report failing with `OSError`
+    is retried every ``retry_interval`` seconds.
+    """
+
+    DROP_OLDEST = 0
+    """When the queue is full, drop the oldest queued report to make room."""
+    COALESCE = 1
+    """When the queue is full, replace the newest queued report with the new one, if it has
+    the same report ID. Otherwise, drop the oldest queued report as `DROP_OLDEST` does."""
+    BLOCK = 2
+    """When the queue is full, wait until a report has been sent."""
+
+    def __init__(
+        self,
+        device: object,
+        *,
+        slots: int = 32,
+        report_length: int = 64,
+        policy: int = DROP_OLDEST,
+        retry_interval: float = 0.001,
+        background: bool = threading is not None,
+    ) -> None:
+        """Create a QueuedDevice wrapping the given device.
+
+        :param device: The device to wrap: any object that implements ``send_report()``,
+          ``usage_page`` and ``usage``, such as one returned by `find_device`.
+        :param slots: Maximum number of reports waiting to be sent. Defaults to 32.
+        :param report_length: Length in bytes of the longest report. Defaults to 64.
+        :param policy: What to do with a new report when the queue is full:
+          `DROP_OLDEST` (the default), `COALESCE` or `BLOCK`.
+        :param retry_interval: Time in seconds before sending again a report that
+          failed with `OSError`. Defaults to 0.001.
+        :param background: True to send reports from a background thread, False to send
+          them only when `process` is called. Defaults to True where threads are available.
+
+        Example::
+
+            device = QueuedDevice(find_device(devices, usage_page=0x1, usage=0x02))
+            mouse = Mouse(device)
+            # Never blocks, even if the host stops polling.
+            mouse.move(10, 0)
+            print(device.dropped, "reports dropped")
+        """
+        super().__init__(device)
+        self.policy = policy
+        self.retry_interval = retry_interval
+
+        self.dropped = 0
+        """Number of reports dropped to make room for a new one."""
+        self.coalesced = 0
+        """Number of queued reports replaced by a newer one by the `COALESCE` policy."""
+
+        # Ring of report slots: the oldest report is at _head, _count reports are queued.
+        self._slots = slots
+        self._report_length = report_length
+        self._buffer = bytearray(slots * report_length)
+        self._view = memoryview(self._buffer)
+        self._lengths = [0] * slots
+        self._report_ids = [None] * slots
+        self._head = 0
+        self._count = 0
+
+        # Copy of the report being sent, and its length (None if there is none).
+        self._sending = bytearray(report_length)
+        self._sending_view = memoryview(self._sending)
+        self._sending_length = None
+        self._sending_report_id = None
+
+        self._closed = False
+        self._thread = None
+        if background:
+            if threading is None:
+                raise RuntimeError("Background sending requires threads.")
+            self._condition = threading.Condition()
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        else:
+            self._condition = _NoLock()
+
+    @property
+    def pending(self) -> int:
+        """Number of reports waiting to be sent, including one being sent."""
+        return self._count + (self._sending_length is not None)
+
+    def send_report(self, report: bytes, report_id: Optional[int] = None) -> None:
+        """Queue the report to be sent. Returns right away, unless the queue is full
+        and the policy is `BLOCK`.
+
+        :param report: The report to send.
+        :param report_id: The report ID, if the wrapped device uses several report IDs.
+        :raises ValueError: if the report is longer than ``report_length``.
+        """
+        length = len(report)
+        if length > self._report_length:
+            raise ValueError(
+                "Report must not be longer than {} bytes.".format(self._report_length)
+            )
+        with self._condition:
+            if self._count == self._slots:
+                if self.policy == self.COALESCE:
+                    newest = (self._head + self._count - 1) % self._slots
+                    if self._report_ids[newest] == report_id:
+                        self._store(newest, report, report_id)
+                        self.coalesced += 1
+                        return
+                if self.policy == self.BLOCK:
+                    self._wait_for_room()
+                if self._count == self._slots:
+                    # Drop the oldest report: DROP_OLDEST, COALESCE with another report ID,
+                    # or BLOCK interrupted by close().
+                    self._head = (self._head + 1) % self._slots
+                    self._count -= 1
+                    self.dropped += 1
+            self._store((self._head + self._count) % self._slots, report, report_id)
+            self._count += 1
+            self._condition.notify_all()
+
+    def process(self) -> int:
+        """Send the queued reports, stopping at the first one failing with `OSError`,
+        which is sent again by the next call. Use this when there is no background thread,
+        for instance from the main loop.
+
+        :returns: the number of reports sent.
+        """
+        sent = 0
+        while self._send_next():
+            sent += 1
+        return sent
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until all queued reports have been sent.
+
+        :param timeout: Time in seconds to wait. Defaults to None to wait indefinitely.
+        :returns: True if all reports were sent, False on timeout.
+        """
+        start = time.monotonic()
+        while self.pending:
+            if timeout is not None and time.monotonic() - start >= timeout:
+                return False
+            if self._thread is None:
+                if not self._send_next():
+                    time.sleep(self.retry_interval)
+            else:
+                with self._condition:
+                    if self.pending:
+                        self._condition.wait(self.retry_interval)
+        return True
+
+    def close(self) -> None:
+        """Stop the background thread. Reports still queued are not sent."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _store(self, index: int, report: bytes, report_id: Optional[int]) -> None:
+        start = index * self._report_length
+        length = len(report)
+        self._view[start : start + length] = report
+        self._lengths[index] = length
+        self._report_ids[index] = report_id
+
+    def _wait_for_room(self) -> None:
+        """Wait until a queued report has been sent. Called with the lock held."""
+        if self._thread is None:
+            # No writer to wait for: make room by sending the oldest report.
+            while self._count == self._slots:
+                if not self._send_next():
+                    time.sleep(self.retry_interval)
+        while self._count == self._slots and not self._closed:
+            self._condition.wait()
+
+    def _send_next(self) -> bool:
+        """Send the report being sent, or else the oldest queued report.
+
+        :returns: True if a report was sent, False if there was none or sending failed.
+        """
+        if self._sending_length is None:
+            with self._condition:
+                if not self._count:
+                    return False
+                head = self._head
+                start = head * self._report_length
+                length = self._lengths[head]
+                self._sending_view[:length] = self._view[start : start + length]
+                self._sending_length = length
+                self._sending_report_id = self._report_ids[head]
+                self._head = (head + 1) % self._slots
+                self._count -= 1
+                self._condition.notify_all()
+        report = self._sending_view[: self._sending_length]
+        try:
+            if self._sending_report_id is None:
+                self._device.send_report(report)
+            else:
+                self._device.send_report(report, self._sending_report_id)
+        except OSError:
+            return False
+        with self._condition:
+            self._sending_length = None
+            self._condition.notify_all()
+        return True
+
+    def _run(self) -> None:
+        """Background thread: send reports as they are queued."""
+        while not self._closed:
+            if self._send_next():
+                continue
+            with self._condition:
+                if self._sending_length is None and not self._count:
+                    # Nothing to send: wait for a new report.
+                    if not self._closed:
+                        self._condition.wait()
+                    continue
+            # Sending failed: try again later.
+            time.sleep(self.retry_interval)
@@ -0,0 +1,240 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`adafruit_hid.recording_device.RecordingDevice`
+====================================================
+
+* Author(s): quaxalber
+"""
+
+import time
+
+try:
+    from typing import Callable, Iterator, Optional, Sequence, Tuple
+except ImportError:
+    pass
+
+
+# pylint: disable=too-many-arguments, too-many-instance-attributes
+class RecordingDevice:
+    """A HID device that records the reports sent to it, for tests and benchmarks.
+
+    Reports are copied with their report ID and timestamps into a ring of preallocated
+    slots: once ``capacity`` reports are recorded, each new report replaces the oldest.
+    The device can simulate a host polling it every ``poll_interval`` seconds, fail
+    with `OSError` like a stalled USB connection, and replay output reports. It implements
+    the same interface as ``usb_hid.Device``.
+    """
+
+    def __init__(
+        self,
+        *,
+        usage_page: int = 0x1,
+        usage: int = 0x06,
+        capacity: int = 1024,
+        report_length: int = 64,
+        poll_interval: Optional[float] = None,
+        wait: bool = False,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ) -> None:
+        """Create a RecordingDevice.
+
+        :param usage_page: The usage page to report. Defaults to Generic Desktop (0x1).
+        :param usage: The usage to report. Defaults to Keyboard (0x06).
+        :param capacity: Number of reports kept. Defaults to 1024.
+        :param report_length: Length in bytes of the longest report. Defaults to 64.
+        :param poll_interval: Time in seconds between two host polls. Each report is
+          delivered at the first poll after it is sent, and after the previous report.
+          Defaults to None for a host reading reports as soon as they are sent.
+        :param wait: True to make `send_report` wait until the report is delivered,
+          like ``usb_hid.Device``. Defaults to False to only record the delivery time.
+        :param clock: Function returning the current time in nanoseconds.
+          Defaults to `time.monotonic_ns`. Pass a function returning controlled values
+          for deterministic timestamps.
+
+        Example::
+
+            device = RecordingDevice(poll_interval=0.001)
+            kbd = Keyboard(device)
+            kbd.send(Keycode.A)
+            for sent, delivered, report_id, report in device.reports():
+                print(delivered - sent, bytes(report))
+        """
+        self.usage_page = usage_page
+        self.usage = usage
+        self.wait = wait
+        self._clock = clock
+        self._poll_interval_ns = (
+            None if poll_interval is None else int(poll_interval * 1_000_000_000)
+        )
+
+        self.sent = 0
+        """Number of reports recorded since the device was created or cleared."""
+        self.failed = 0
+        """Number of reports refused with `OSError` by `stall`."""
+
+        # Ring of recorded reports: the newest report is at _next - 1.
+        self._capacity = capacity
+        self._report_length = report_length
+        self._buffer = bytearray(capacity * report_length)
+        self._view = memoryview(self._buffer)
+        self._lengths = [0] * capacity
+        self._report_ids = [None] * capacity
+        self._sent_times = [0] * capacity
+        self._delivered_times = [0] * capacity
+        self._next = 0
+        self._last_delivered = None
+
+        self._stalls = 0
+        self._stall_until = None
+
+        # Output reports waiting to be read by get_last_received_report().
+        self._received = {}
+        self._replay = []
+        self._replay_due = 0
+        self._replay_interval_ns = None
+
+    @property
+    def recorded(self) -> int:
+        """Number of reports kept, at most ``capacity``."""
+        return min(self.sent, self._capacity)
+
+    def send_report(self, report: bytes, report_id: Optional[int] = None) -> None:
+        """Record the report.
+
+        :param report: The report sent.
+        :param report_id: The report ID, if any.
+        :raises OSError: if the device is stalled by `stall`.
+        :raises ValueError: if the report is longer than ``report_length``.
+        """
+        now = self._clock()
+        if self._stalls or (self._stall_until is not None and now < self._stall_until):
+            if self._stalls:
+                self._stalls -= 1
+            self.failed += 1
+            raise OSError("USB busy")
+        length = len(report)
+        if length > self._report_length:
+            raise ValueError(
+                "Report must not be longer than {} bytes.".format(self._report_length)
+            )
+        delivered = now
+        interval = self._poll_interval_ns
+        if interval is not None and self._last_delivered is not None:
+            delivered = max(delivered, self._last_delivered + interval)
+        self._last_delivered = delivered
+
+        index = self._next
+        start = index * self._report_length
+        self._view[start : start + length] = report
+        self._lengths[index] = length
+        self._report_ids[index] = report_id
+        self._sent_times[index] = now
+        self._delivered_times[index] = delivered
+        self._next = (index + 1) % self._capacity
+        self.sent += 1
+
+        if self.wait and delivered > now:
+            time.sleep((delivered - now) / 1_000_000_000)
+
+    def report(self, index: int) -> memoryview:
+        """The recorded report at the given index, 0 being the oldest kept and -1 the
+        newest. The memoryview is only valid until the slot is reused."""
+        index = self._slot(index)
+        start = index * self._report_length
+        return self._view[start : start + self._lengths[index]]
+
+    def reports(self) -> Iterator[Tuple[int, int, Optional[int], memoryview]]:
+        """Iterate over the recorded reports, from the oldest kept to the newest.
+
+        Yields ``(sent, delivered, report_id, report)`` tuples: the times in nanoseconds
+        at which the report was sent and delivered to the host, its report ID and its
+        content.
+        """
+        for i in range(self.recorded):
+            index = self._slot(i)
+            start = index * self._report_length
+            yield (
+                self._sent_times[index],
+                self._delivered_times[index],
+                self._report_ids[index],
+                self._view[start : start + self._lengths[index]],
+            )
+
+    def clear(self) -> None:
+        """Forget the recorded reports and reset the counters."""
+        self.sent = 0
+        self.failed = 0
+        self._next = 0
+        self._last_delivered = None
+
+    def stall(self, count: int = 1, *, duration: Optional[float] = None) -> None:
+        """Make the next reports fail with `OSError`, as when the host stops polling.
+
+        :param count: Number of reports to refuse.
+        :param duration: Time in seconds during which all reports are refused instead,
+          if given.
+        """
+        if duration is None:
+            self._stalls = count
+        else:
+            self._stall_until = self._clock() + int(duration * 1_000_000_000)
+
+    def receive_report(self, report: bytes, report_id: Optional[int] = None) -> None:
+        """Simulate an output report sent by the host, such as keyboard LEDs.
+
+        :param report: The output report.
+        :param report_id: The report ID, if any.
+        """
+        self._received[report_id] = bytes(report)
+
+    def replay(
+        self,
+        reports: Sequence[Tuple[Optional[int], bytes]],
+        interval: Optional[float] = None,
+    ) -> None:
+        """Replay a sequence of output reports, in order.
+
+        :param reports: ``(report_id, report)`` tuples, as sent by the host.
+        :param interval: Time in seconds between two reports, starting now. Defaults to
+          None to receive one report on each call to `get_last_received_report`.
+        """
+        self._replay = list(reports)
+        self._replay.reverse()
+        self._replay_due = self._clock()
+        self._replay_interval_ns = (
+            None if interval is None else int(interval * 1_000_000_000)
+        )
+
+    def get_last_received_report(
+        self, report_id: Optional[int] = None
+    ) -> Optional[bytes]:
+        """Return the last output report received for the given report ID, or None if no
+        report was received since the last call."""
+        self._receive_replayed()
+        return self._received.pop(report_id, None)
+
+    def _receive_replayed(self) -> None:
+        replay = self._replay
+        if not replay:
+            return
+        if self._replay_interval_ns is None:
+            report_id, report = replay.pop()
+            self.receive_report(report, report_id)
+            return
+        # Receive every report due by now; later ones overwrite earlier ones.
+        now = self._clock()
+        while replay and now >= self._replay_due:
+            report_id, report = replay.pop()
+            self.receive_report(report, report_id)
+            self._replay_due += self._replay_interval_ns
+
+    def _slot(self, index: int) -> int:
+        count = self.recorded
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("No recorded report at this index.")
+        return (self._next - count + index) % self._capacity
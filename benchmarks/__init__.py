@@ -0,0 +1,290 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`benchmarks`
+====================================================
+
+Benchmarks of the report generation hot paths, timed against a `RecordingDevice`.
+
+Each benchmark runs a fixed workload of ``ops`` operations and measures the time per
+operation, the number of reports sent per operation and the memory allocated per
+operation. Run them on CPython with ``python -m benchmarks``.
+
+* Author(s): quaxalber
+"""
+
+import math
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import adafruit_hid
+from adafruit_hid.digitizer import Digitizer
+from adafruit_hid.gamepad import Gamepad
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keycode import Keycode
+from adafruit_hid.mouse import Mouse
+from adafruit_hid.recording_device import RecordingDevice
+
+# Text typed by the layout benchmark: every printable ASCII character, repeated.
+TEXT = (
+    "The quick brown fox jumps over the lazy dog. 0123456789\n"
+    "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG! ~`@#$%^&*()_+-=[]{}|;':\",./<>?\\\n"
+) * 16
+
+# Operations measured one by one for allocations.
+_ALLOCATION_OPS = 64
+
+
+def keyboard_press_release(device):
+    """Press and release one key at a time, cycling through the letters."""
+    keyboard = Keyboard(device)
+    keycodes = tuple(range(Keycode.A, Keycode.Z + 1))
+
+    def run(ops):
+        for i in range(ops):
+            keycode = keycodes[i % 26]
+            keyboard.press(keycode)
+            keyboard.release(keycode)
+
+    return run, 10000
+
+
+def keyboard_press_key(device):
+    """Same as keyboard_press_release, with the single-keycode methods."""
+    keyboard = Keyboard(device)
+    keycodes = tuple(range(Keycode.A, Keycode.Z + 1))
+
+    def run(ops):
+        for i in range(ops):
+            keycode = keycodes[i % 26]
+            keyboard.press_key(keycode)
+            keyboard.release_key(keycode)
+
+    return run, 10000
+
+
+def keyboard_nkro_press_key(device):
+    """Same as keyboard_press_key, on an NKRO keyboard."""
+    keyboard = Keyboard(device, nkro=True)
+    keycodes = tuple(range(Keycode.A, Keycode.Z + 1))
+
+    def run(ops):
+        for i in range(ops):
+            keycode = keycodes[i % 26]
+            keyboard.press_key(keycode)
+            keyboard.release_key(keycode)
+
+    return run, 10000
+
+
+def layout_write(device):
+    """Type a large text, one operation per character."""
+    layout = KeyboardLayoutUS(Keyboard(device))
+
+    def run(ops):
+        layout.write(TEXT[:ops])
+
+    return run, len(TEXT)
+
+
+def mouse_stream(device):
+    """Move the mouse along a circle, as a 1 kHz sensor would report it."""
+    mouse = Mouse(device)
+    steps = 1000
+    moves = tuple(
+        (
+            3.5 * math.cos(2 * math.pi * i / steps),
+            3.5 * math.sin(2 * math.pi * i / steps),
+        )
+        for i in range(steps)
+    )
+
+    def run(ops):
+        for i in range(ops):
+            x, y = moves[i % steps]
+            mouse.move(x, y)
+
+    return run, steps * 10
+
+
+def gamepad_sweep(device):
+    """Sweep both analog sticks and triggers over their full range."""
+    gamepad = Gamepad(device)
+    values = tuple(range(-127, 128)) + tuple(range(126, -127, -1))
+    count = len(values)
+
+    def run(ops):
+        for i in range(ops):
+            value = values[i % count]
+            trigger = abs(value)
+            gamepad.move_joysticks(value, -value, value, -value, trigger, trigger)
+
+    return run, count * 20
+
+
+def gamepad_stick_x(device):
+    """Same as gamepad_sweep, moving only the X axis of the left stick."""
+    gamepad = Gamepad(device)
+    values = tuple(range(-127, 128)) + tuple(range(126, -127, -1))
+    count = len(values)
+
+    def run(ops):
+        for i in range(ops):
+            gamepad.move_joysticks(x=values[i % count])
+
+    return run, count * 20
+
+
+def digitizer_strokes(device):
+    """Draw pen strokes: diagonal lines with a varying pressure."""
+    digitizer = Digitizer(device)
+    length = 500
+
+    def run(ops):
+        for i in range(ops):
+            step = i % length
+            digitizer.update(
+                x=step * 64,
+                y=(length - step) * 64,
+                pressure=step * 16,
+                tip_switch=step < length - 1,
+            )
+
+    return run, length * 10
+
+
+BENCHMARKS = {
+    "keyboard_press_release": (0x1, 0x06, keyboard_press_release),
+    "keyboard_press_key": (0x1, 0x06, keyboard_press_key),
+    "keyboard_nkro_press_key": (0x1, 0x06, keyboard_nkro_press_key),
+    "layout_write": (0x1, 0x06, layout_write),
+    "mouse_stream": (0x1, 0x02, mouse_stream),
+    "gamepad_sweep": (0x1, 0x05, gamepad_sweep),
+    "gamepad_stick_x": (0x1, 0x05, gamepad_stick_x),
+    "digitizer_strokes": (0x0D, 0x02, digitizer_strokes),
+}
+"""The benchmarks, by name: the usage page and usage of the device, and a function
+taking the device and returning a function running the given number of operations,
+and the number of operations of the workload."""
+
+
+def run_benchmark(name, repeat=5):
+    """Run one benchmark and return its results.
+
+    :param name: The name of the benchmark, a key of `BENCHMARKS`.
+    :param repeat: Number of times the workload is timed; the fastest run is kept.
+    :returns: a dict with the benchmark ``name``, the number of ``ops``, and the
+      ``ns_per_op``, ``reports_per_op`` and ``alloc_bytes_per_op`` measured.
+    """
+    usage_page, usage, workload = BENCHMARKS[name]
+    device = RecordingDevice(usage_page=usage_page, usage=usage, clock=_no_clock)
+    run, ops = workload(device)
+    # Warm up, so that lazily built tables do not count.
+    run(ops)
+
+    best = None
+    for _ in range(repeat):
+        device.clear()
+        start = time.perf_counter_ns()
+        run(ops)
+        elapsed = time.perf_counter_ns() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    reports = device.sent
+
+    # Peak memory above the baseline while running one operation, less the cost of
+    # calling run() itself: 0 means the operation allocates nothing. The reports go to a
+    # device that allocates nothing itself, unlike the RecordingDevice.
+    run, _ = workload(_NullDevice(usage_page, usage))
+    run(ops)
+    overhead = _peak_allocation(run, 0)
+    allocated = 0
+    for _ in range(_ALLOCATION_OPS):
+        allocated += max(0, _peak_allocation(run, 1) - overhead)
+
+    return {
+        "name": name,
+        "ops": ops,
+        "ns_per_op": best / ops,
+        "reports_per_op": reports / ops,
+        "alloc_bytes_per_op": allocated / _ALLOCATION_OPS,
+    }
+
+
+def _peak_allocation(run, ops):
+    """Return the peak memory allocated by tracemalloc while running ``ops`` operations."""
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        run(ops)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+class _NullDevice:
+    """Device discarding the reports sent to it."""
+
+    def __init__(self, usage_page, usage):
+        self.usage_page = usage_page
+        self.usage = usage
+
+    # Same signature as the devices it stands for, and nothing to do.
+    # pylint: disable=unused-argument, no-self-use
+    def send_report(self, report, report_id=None):
+        """Discard the report."""
+
+    def get_last_received_report(self, report_id=None):
+        """No report is ever received."""
+        return None
+
+
+def _no_clock():
+    """Clock for the recording devices: timestamps are not needed, and allocating them
+    would count against the benchmarks."""
+    return 0
+
+
+def run_all(names=None, repeat=5, label=None):
+    """Run the given benchmarks, or all of them, and return the results.
+
+    :param names: The names of the benchmarks to run. Defaults to None for all of them.
+    :param repeat: Number of times each workload is timed.
+    :param label: Name of the code measured, recorded as ``"revision"``. Defaults to None
+      for the ``git describe`` output of the source tree, since ``__version__`` is only
+      set in releases.
+    :returns: a dict describing the Python implementation and the code measured, with the
+      results of each benchmark under ``"benchmarks"``.
+    """
+    if names is None:
+        names = tuple(BENCHMARKS)
+    if label is None:
+        label = _describe()
+    return {
+        "implementation": sys.implementation.name,
+        "python": sys.version.split()[0],
+        "revision": label,
+        "benchmarks": [run_benchmark(name, repeat) for name in names],
+    }
+
+
+def _describe():
+    """Return ``git describe`` for the tree adafruit_hid is imported from, or its
+    ``__version__`` if it is not in a git work tree."""
+    try:
+        return subprocess.run(
+            ("git", "describe", "--always", "--dirty"),
+            cwd=os.path.dirname(os.path.abspath(adafruit_hid.__file__)),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return adafruit_hid.__version__
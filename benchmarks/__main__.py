@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+"""Run the benchmarks and print the results as JSON.
+
+Usage::
+
+    python -m benchmarks [--repeat N] [--label LABEL] [--output FILE] [NAME ...]
+"""
+
+import argparse
+import json
+import sys
+
+from . import BENCHMARKS, run_all
+
+
+def main(argv=None):
+    """Parse the command line, run the benchmarks and write the results."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark the adafruit_hid report generation hot paths.",
+    )
+    parser.add_argument(
+        "names",
+        nargs="*",
+        metavar="NAME",
+        help="benchmarks to run, among: {}".format(", ".join(BENCHMARKS)),
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="timed runs of each workload"
+    )
+    parser.add_argument(
+        "--label",
+        help="name of the code measured, such as a branch; defaults to git describe",
+    )
+    parser.add_argument(
+        "--output", help="file to write the results to, instead of the standard output"
+    )
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error("unknown benchmark: {}".format(name))
+
+    results = run_all(args.names or None, args.repeat, args.label)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keycode import Keycode
+
+_ascii_to_keycode = bytearray(KeyboardLayoutUS.ASCII_TO_KEYCODE)
+_ascii_to_keycode[ord("^")] = 0
+_ascii_to_keycode[ord("@")] = Keycode.Q
+
+
+class KeyboardLayoutSample(KeyboardLayoutUS):  # pylint: disable=too-few-public-methods
+    """US layout with a dead ^ on shift+6, @ and € typed with altgr, é and è on a key
+    of their own, and ñ typed with the altgr+` dead key."""
+
+    ASCII_TO_KEYCODE = bytes(_ascii_to_keycode)
+    NEED_ALTGR = "@€"
+    HIGHER_ASCII = {0xE9: 0x64, 0xE8: 0x64 | 0x80, "€": Keycode.E}
+    COMBINED_KEYS = {
+        0xE2: (Keycode.SIX | 0x80) << 8 | ord("a"),
+        0xEA: (Keycode.SIX | 0x80) << 8 | ord("e"),
+        ord("^"): (Keycode.SIX | 0x80) << 8 | ord(" "),
+        0xF1: Keycode.GRAVE_ACCENT << 8 | 0x80 | ord("n"),
+    }
+
+
+def typed_text(layout_class, reports):
+    """Decode keyboard reports into the text a host using the layout would see."""
+    text = []
+    previous = bytes(8)
+    dead_key = 0
+    for report in reports:
+        for keycode in report[2:]:
+            if not keycode or keycode in previous[2:]:
+                continue
+            dead = layout_class.dead_key(keycode, report[0])
+            if dead and not dead_key:
+                dead_key = dead
+                continue
+            char = layout_class.keycode_to_char(keycode, report[0], dead_key)
+            dead_key = 0
+            text.append("?" if char is None else char)
+        previous = bytes(report)
+    return "".join(text)
@@ -0,0 +1,77 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import tracemalloc
+
+import pytest
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_base import KeyboardLayoutBase
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keycode import Keycode
+
+TEXT = "The quick brown fox jumps over the lazy dog.\n" * 20
+
+
+class NullDevice:
+    """Keyboard device discarding the reports, without allocating."""
+
+    usage_page = 0x1
+    usage = 0x06
+
+    def send_report(self, report, report_id=None):
+        pass
+
+
+def peak_allocation(function, *args):
+    """Return the peak memory allocated while calling the function, after a warm-up."""
+    function(*args)
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        function(*args)
+        return tracemalloc.get_traced_memory()[1] - baseline
+    finally:
+        tracemalloc.stop()
+
+
+def press_and_release(keyboard, keycodes):
+    # Indexing, as iterating over the keycodes would allocate an iterator.
+    count = len(keycodes)
+    i = 0
+    while i < count:
+        keyboard.press_key(keycodes[i])
+        i += 1
+    i = 0
+    while i < count:
+        keyboard.release_key(keycodes[i])
+        i += 1
+
+
+@pytest.mark.parametrize("nkro", (False, True))
+def test_press_key_allocates_none(nkro):
+    keyboard = Keyboard(NullDevice(), nkro=nkro)
+    keycodes = (Keycode.SHIFT, Keycode.A, Keycode.B, Keycode.C, Keycode.D)
+    assert peak_allocation(press_and_release, keyboard, keycodes) == 0
+
+
+def test_eviction_allocates_nothing():
+    keyboard = Keyboard(NullDevice())
+    keycodes = tuple(range(Keycode.A, Keycode.Z + 1))
+    assert peak_allocation(press_and_release, keyboard, keycodes) == 0
+
+
+@pytest.mark.parametrize(
+    "typing_mode",
+    (
+        KeyboardLayoutBase.TYPING_SEQUENTIAL,
+        KeyboardLayoutBase.TYPING_MINIMAL,
+        KeyboardLayoutBase.TYPING_ROLLOVER,
+    ),
+)
+def test_write_alloc_is_constant(typing_mode):
+    layout = KeyboardLayoutUS(Keyboard(NullDevice()), typing_mode)
+    # Calling write() costs a fixed amount, whatever the length of the text.
+    assert peak_allocation(layout.write, TEXT) <= peak_allocation(layout.write, "A")
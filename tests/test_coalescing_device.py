@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid import coalescing_device
+from adafruit_hid.coalescing_device import CoalescingDevice
+from adafruit_hid.gamepad import Gamepad
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keycode import Keycode
+from adafruit_hid.mouse import Mouse
+from adafruit_hid.recording_device import RecordingDevice
+
+
+class Clock:
+    """Stand-in for time.monotonic, in seconds."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_drops_duplicates():
+    device = RecordingDevice(usage_page=0x1, usage=0x06)
+    coalescing = CoalescingDevice(device)
+    keyboard = Keyboard(coalescing)
+    keyboard.press(Keycode.A)
+    keyboard.press(Keycode.A)
+    keyboard.release_all()
+    assert device.sent == 2
+    assert coalescing.dropped == 1
+
+
+def test_refuses_mouse():
+    device = RecordingDevice(usage_page=0x1, usage=0x02)
+    with pytest.raises(ValueError):
+        Mouse(CoalescingDevice(device))
+
+
+def test_interval_keeps_latest(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(coalescing_device.time, "monotonic", clock)
+    device = RecordingDevice(usage_page=0x1, usage=0x05)
+    coalescing = CoalescingDevice(device, interval=0.008)
+    gamepad = Gamepad(coalescing)
+    assert device.sent == 1
+    for x in range(1, 5):
+        gamepad.move_joysticks(x=x)
+    # Within the interval, the moves are held back and replace each other.
+    assert device.sent == 1
+    assert coalescing.coalesced == 3
+    coalescing.update()
+    assert device.sent == 1
+    clock.now = 0.008
+    coalescing.update()
+    assert device.sent == 2
+    expected = RecordingDevice(usage_page=0x1, usage=0x05)
+    Gamepad(expected).move_joysticks(x=4)
+    assert bytes(device.report(-1)) == bytes(expected.report(-1))
+
+
+def test_flush_sends_held_reports():
+    device = RecordingDevice(usage_page=0x1, usage=0x05)
+    coalescing = CoalescingDevice(device, interval=60)
+    coalescing.send_report(b"\x01")
+    coalescing.send_report(b"\x02")
+    coalescing.flush()
+    assert [bytes(report) for *_, report in device.reports()] == [b"\x01", b"\x02"]
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+# pylint: disable=protected-access
+
+import pytest
+
+import adafruit_hid
+from adafruit_hid import find_device, wait_for_usb
+from adafruit_hid.recording_device import RecordingDevice
+
+
+class Runtime:  # pylint: disable=too-few-public-methods
+    """Stand-in for supervisor.runtime."""
+
+    def __init__(self, usb_connected):
+        self.usb_connected = usb_connected
+
+
+class Supervisor:  # pylint: disable=too-few-public-methods
+    """Stand-in for the supervisor module."""
+
+    def __init__(self, usb_connected):
+        self.runtime = Runtime(usb_connected)
+
+
+def make_devices():
+    return [
+        RecordingDevice(usage_page=0x1, usage=0x06),
+        RecordingDevice(usage_page=0x1, usage=0x02),
+        RecordingDevice(usage_page=0x0C, usage=0x01),
+    ]
+
+
+def test_cached_index():
+    devices = make_devices()
+    assert find_device(devices, usage_page=0x1, usage=0x02) is devices[1]
+    assert find_device(devices, usage_page=0x1, usage=0x02) is devices[1]
+    # The sequence changed: the cached index is checked and the search starts over.
+    devices.reverse()
+    assert find_device(devices, usage_page=0x1, usage=0x02) is devices[1]
+    devices.insert(0, RecordingDevice(usage_page=0x1, usage=0x05))
+    assert find_device(devices, usage_page=0x1, usage=0x02) is devices[2]
+
+
+def test_cache_does_not_grow():
+    for _ in range(10):
+        devices = make_devices()
+        assert find_device(devices, usage_page=0x0C, usage=0x01) is devices[2]
+    keys = [key for key in adafruit_hid._device_indices if key == (0x0C, 0x01)]
+    assert len(keys) == 1
+    assert adafruit_hid._device_indices[(0x0C, 0x01)][0] is devices
+
+
+def test_no_matching_device():
+    with pytest.raises(ValueError):
+        find_device(make_devices(), usage_page=0x1, usage=0x05)
+
+
+def test_single_device():
+    device = RecordingDevice(usage_page=0x1, usage=0x06)
+    assert find_device(device, usage_page=0x1, usage=0x06) is device
+
+
+def test_wait_for_usb_check_once(monkeypatch):
+    monkeypatch.setattr(adafruit_hid, "_usb_ready", False)
+    monkeypatch.setattr(adafruit_hid, "supervisor", Supervisor(False))
+    with pytest.raises(OSError):
+        wait_for_usb(0)
+    adafruit_hid.supervisor.runtime.usb_connected = True
+    wait_for_usb(0)
+    assert adafruit_hid._usb_ready
+
+
+def test_wait_for_usb_blinka(monkeypatch):
+    monkeypatch.setattr(adafruit_hid, "_usb_ready", False)
+    monkeypatch.setattr(adafruit_hid, "supervisor", None)
+    sleeps = []
+    monkeypatch.setattr(adafruit_hid.time, "sleep", sleeps.append)
+    # A wait of 0 seconds cannot tell that USB is ready.
+    wait_for_usb(0)
+    assert not adafruit_hid._usb_ready
+    wait_for_usb()
+    assert adafruit_hid._usb_ready
+    wait_for_usb()
+    assert sleeps == [0, 1.0]
@@ -0,0 +1,193 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid.gamepad import Gamepad
+from adafruit_hid.recording_device import RecordingDevice
+
+
+def make_gamepad():
+    device = RecordingDevice(usage_page=0x1, usage=0x05)
+    return device, Gamepad(device)
+
+
+def test_rumble_payload():
+    # usb_hid.Device and HidgDevice return the payload without the report ID.
+    device, gamepad = make_gamepad()
+    device.replay([(5, b"\x80")])
+    assert gamepad.get_rumble_intensity() == 0x80
+
+
+def test_rumble_report_with_id():
+    device, gamepad = make_gamepad()
+    device.replay([(5, b"\x05\x40")])
+    assert gamepad.get_rumble_intensity() == 0x40
+
+
+def test_rumble_other_report_id():
+    device, gamepad = make_gamepad()
+    device.replay([(5, b"\x04\x40")])
+    assert gamepad.get_rumble_intensity() is None
+
+
+def test_rumble_callbacks():
+    device, gamepad = make_gamepad()
+    intensities = []
+    gamepad.add_rumble_callback(intensities.append)
+    device.replay([(5, b"\x80"), (5, b"\x80"), (5, b"\x00")])
+    assert gamepad.update()
+    assert not gamepad.update()
+    assert gamepad.update()
+    assert not gamepad.update()
+    assert intensities == [0x80, 0x00]
+
+    gamepad.remove_rumble_callback(intensities.append)
+    device.replay([(5, b"\xff")])
+    assert gamepad.update()
+    assert intensities == [0x80, 0x00]
+
+
+def axes(device):
+    """The six axis bytes of the last report sent."""
+    return tuple(device.report(-1)[-6:])
+
+
+def test_axis_encoding():
+    device, gamepad = make_gamepad()
+    gamepad.move_joysticks(x=-127, y=127, rx=0, ry=1, l2=127, r2=64)
+    assert axes(device) == (1, 255, 128, 129, 255, 129)
+
+
+def test_only_given_axes_change():
+    device, gamepad = make_gamepad()
+    gamepad.move_joysticks(x=10, l2=20)
+    gamepad.move_joysticks(y=-10)
+    assert axes(device) == (138, 118, 128, 128, 40, 128)
+
+
+def test_unchanged_axes_not_sent():
+    device, gamepad = make_gamepad()
+    gamepad.move_joysticks(x=5)
+    sent = device.sent
+    gamepad.move_joysticks(x=5, y=0)
+    assert device.sent == sent
+
+
+def test_fractional_values_rounded():
+    device, gamepad = make_gamepad()
+    gamepad.move_joysticks(x=3, y=-126.6, l2=126.7)
+    assert axes(device) == (131, 1, 128, 128, 255, 128)
+
+
+@pytest.mark.parametrize(
+    "kwargs", ({"x": -128}, {"ry": 128}, {"l2": -1}, {"r2": 128}, {"x": -300})
+)
+def test_out_of_range(kwargs):
+    _, gamepad = make_gamepad()
+    with pytest.raises(ValueError):
+        gamepad.move_joysticks(**kwargs)
+
+
+def test_set_axes():
+    device, gamepad = make_gamepad()
+    gamepad.set_axes((-127, 127, 0, 1))
+    gamepad.set_axes((127, 64.2), Gamepad.AXIS_L2)
+    assert axes(device) == (1, 255, 128, 129, 255, 129)
+    with pytest.raises(ValueError):
+        gamepad.set_axes((0, 0), Gamepad.AXIS_R2)
+    with pytest.raises(ValueError):
+        gamepad.set_axes((0, 200))
+
+
+def test_batch_sends_one_report():
+    device, gamepad = make_gamepad()
+    sent = device.sent
+    with gamepad.batch():
+        gamepad.press_buttons(Gamepad.BUTTON_1)
+        with gamepad.batch():
+            gamepad.move_hat(Gamepad.HAT_LEFT)
+        gamepad.move_joysticks(x=-127)
+    assert device.sent == sent + 1
+    report = device.report(-1)
+    assert report[1] == 0x01
+    assert report[3] == Gamepad.HAT_LEFT
+    assert axes(device)[0] == 1
+
+
+def test_batch_unsent_on_error():
+    device, gamepad = make_gamepad()
+    sent = device.sent
+    with pytest.raises(RuntimeError):
+        with gamepad.batch():
+            gamepad.press_buttons(Gamepad.BUTTON_2)
+            raise RuntimeError
+    assert device.sent == sent
+    # The staged change goes out with the next one.
+    gamepad.move_hat(Gamepad.HAT_TOP)
+    assert device.report(-1)[1] == 0x02
+
+
+def test_calibrated_center():
+    device, gamepad = make_gamepad()
+    gamepad.configure_axis(Gamepad.AXIS_X, center=3)
+    gamepad.move_joysticks(x=3)
+    assert axes(device)[0] == 128
+    # The ends of the raw range still give full deflection.
+    gamepad.move_joysticks(x=127)
+    assert axes(device)[0] == 255
+    gamepad.move_joysticks(x=-127)
+    assert axes(device)[0] == 1
+
+
+def test_calibrated_trigger():
+    device, gamepad = make_gamepad()
+    gamepad.configure_axis(Gamepad.AXIS_L2, center=10)
+    gamepad.move_joysticks(l2=5)
+    assert axes(device)[4] == 0
+    gamepad.move_joysticks(l2=127)
+    assert axes(device)[4] == 255
+
+
+def test_configure_reencodes():
+    device, gamepad = make_gamepad()
+    gamepad.move_joysticks(x=3)
+    gamepad.configure_axis(Gamepad.AXIS_X, center=3)
+    assert axes(device)[0] == 128
+
+
+def test_deadzone_and_span():
+    device, gamepad = make_gamepad()
+    gamepad.configure_axis(Gamepad.AXIS_Y, span=100, deadzone=10)
+    gamepad.move_joysticks(y=-10)
+    assert axes(device)[1] == 128
+    gamepad.move_joysticks(y=55)
+    assert axes(device)[1] == 128 + 64
+    gamepad.move_joysticks(y=110)
+    assert axes(device)[1] == 255
+    with pytest.raises(ValueError):
+        gamepad.configure_axis(Gamepad.AXIS_Y, span=10, deadzone=10)
+
+
+def test_curves():
+    device, gamepad = make_gamepad()
+    gamepad.configure_axis(Gamepad.AXIS_RX, curve=2.0)
+    gamepad.move_joysticks(rx=-64)
+    assert axes(device)[2] == 128 - 32
+    gamepad.configure_axis(Gamepad.AXIS_RX, curve=[127 - i for i in range(128)])
+    assert axes(device)[2] == 128 - 63
+    with pytest.raises(ValueError):
+        gamepad.configure_axis(Gamepad.AXIS_RX, curve=[0] * 10)
+
+
+def test_radial_deadzone():
+    device, gamepad = make_gamepad()
+    gamepad.set_radial_deadzone(Gamepad.AXIS_X, 10)
+    gamepad.move_joysticks(x=6, y=6)
+    assert axes(device)[:2] == (128, 128)
+    gamepad.move_joysticks(y=8)
+    assert axes(device)[:2] == (134, 136)
+    gamepad.set_radial_deadzone(Gamepad.AXIS_X, 0)
+    gamepad.move_joysticks(x=1, y=1)
+    assert axes(device)[:2] == (129, 129)
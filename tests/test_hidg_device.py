@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import socket
+
+import pytest
+
+from adafruit_hid.hidg_device import HidgDevice
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keycode import Keycode
+
+
+@pytest.fixture(name="pair")
+def fixture_pair():
+    """A socket pair standing in for the gadget device: the host end, and the file
+    descriptor of the gadget end."""
+    host, device = socket.socketpair(socket.AF_UNIX, socket.SOCK_SEQPACKET)
+    host.settimeout(1)
+    yield host, device.detach()
+    host.close()
+
+
+def test_send_report(pair):
+    host, gadget_fd = pair
+    with HidgDevice(gadget_fd, usage_page=0x1, usage=0x06) as device:
+        keyboard = Keyboard(device)
+        keyboard.press(Keycode.SHIFT, Keycode.A)
+        keyboard.release_all()
+    assert host.recv(64) == bytes((0x02, 0, Keycode.A, 0, 0, 0, 0, 0))
+    assert host.recv(64) == bytes(8)
+
+
+def test_send_report_with_id(pair):
+    host, gadget_fd = pair
+    with HidgDevice(
+        gadget_fd,
+        usage_page=0x1,
+        usage=0x06,
+        report_ids=(1, 2),
+        in_report_lengths=(8, 2),
+    ) as device:
+        device.send_report(b"\x01\x02", 2)
+        device.send_reports(bytes(16))
+    assert host.recv(64) == b"\x02\x01\x02"
+    assert host.recv(64) == b"\x01" + bytes(8)
+    assert host.recv(64) == b"\x01" + bytes(8)
+
+
+def test_read_leds(pair):
+    host, gadget_fd = pair
+    with HidgDevice(
+        gadget_fd, usage_page=0x1, usage=0x06, out_report_lengths=(1,)
+    ) as device:
+        keyboard = Keyboard(device)
+        assert device.get_last_received_report() is None
+        host.send(bytes((Keyboard.LED_NUM_LOCK,)))
+        host.send(bytes((Keyboard.LED_CAPS_LOCK,)))
+        assert device.read_output_reports(timeout=1) == 2
+        # Only the last report is kept.
+        assert keyboard.led_on(Keyboard.LED_CAPS_LOCK)
+        assert not keyboard.led_on(Keyboard.LED_NUM_LOCK)
+        assert device.get_last_received_report() is None
+
+
+def test_read_leds_with_id(pair):
+    host, gadget_fd = pair
+    with HidgDevice(
+        gadget_fd,
+        usage_page=0x1,
+        usage=0x06,
+        report_ids=(1, 2),
+        in_report_lengths=(8, 8),
+        out_report_lengths=(0, 1),
+    ) as device:
+        host.send(b"\x02\x04")
+        assert device.get_last_received_report() == b"\x04"
+        assert device.get_last_received_report(2) is None
+
+
+@pytest.mark.parametrize("write_timeout", (0, 0.01))
+def test_write_timeout(pair, write_timeout):
+    host, gadget_fd = pair
+    with HidgDevice(
+        gadget_fd, usage_page=0x1, usage=0x06, write_timeout=write_timeout
+    ) as device:
+        # Nothing is read on the host end: the socket buffer eventually fills up.
+        with pytest.raises(OSError):
+            for _ in range(100_000):
+                device.send_report(bytes(8))
+        assert host.recv(64) == bytes(8)
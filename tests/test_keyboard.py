@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keycode import Keycode
+from adafruit_hid.recording_device import RecordingDevice
+
+SEVEN_KEYS = (
+    Keycode.A,
+    Keycode.B,
+    Keycode.C,
+    Keycode.D,
+    Keycode.E,
+    Keycode.F,
+    Keycode.G,
+)
+
+
+def make_keyboard(**kwargs):
+    device = RecordingDevice(usage_page=0x1, usage=0x06)
+    return device, Keyboard(device, **kwargs)
+
+
+def last_keys(device):
+    """The keys of the last report sent, ignoring the empty slots."""
+    return sorted(key for key in device.report(-1)[2:] if key)
+
+
+def test_evict_oldest():
+    device, keyboard = make_keyboard()
+    keyboard.press(*SEVEN_KEYS)
+    assert last_keys(device) == sorted(SEVEN_KEYS[1:])
+    # The free slot goes to the next key, and B is now the oldest.
+    keyboard.release(Keycode.C)
+    keyboard.press(Keycode.H, Keycode.I)
+    assert Keycode.B not in last_keys(device)
+    assert Keycode.I in last_keys(device)
+
+
+def test_drop_newest():
+    device, keyboard = make_keyboard(overflow=Keyboard.OVERFLOW_DROP_NEWEST)
+    keyboard.press(*SEVEN_KEYS)
+    assert last_keys(device) == sorted(SEVEN_KEYS[:6])
+    # The dropped key was never pressed: releasing it changes nothing.
+    keyboard.release(Keycode.G)
+    assert last_keys(device) == sorted(SEVEN_KEYS[:6])
+
+
+def test_error_rollover():
+    device, keyboard = make_keyboard(overflow=Keyboard.OVERFLOW_ERROR_ROLLOVER)
+    keyboard.press(Keycode.SHIFT, *SEVEN_KEYS)
+    report = device.report(-1)
+    assert report[0] == 0x02
+    assert bytes(report[2:]) == b"\x01" * 6
+
+
+def test_error_rollover_recovers():
+    device, keyboard = make_keyboard(overflow=Keyboard.OVERFLOW_ERROR_ROLLOVER)
+    keyboard.press(*SEVEN_KEYS)
+    keyboard.press(Keycode.H)
+    keyboard.release(Keycode.A)
+    assert bytes(device.report(-1)[2:]) == b"\x01" * 6
+    # Back to six keys: they are all reported again.
+    keyboard.release(Keycode.D)
+    assert last_keys(device) == sorted(
+        (Keycode.B, Keycode.C, Keycode.E, Keycode.F, Keycode.G, Keycode.H)
+    )
+    keyboard.release_all()
+    assert not any(device.report(-1))
+
+
+def test_repeated_press_not_counted():
+    device, keyboard = make_keyboard(overflow=Keyboard.OVERFLOW_ERROR_ROLLOVER)
+    keyboard.press(*SEVEN_KEYS[:6])
+    keyboard.press(Keycode.A)
+    assert last_keys(device) == sorted(SEVEN_KEYS[:6])
+
+
+def nkro_keys(report):
+    """The keys set in an NKRO report."""
+    return [
+        keycode
+        for keycode in range(0xE0)
+        if report[1 + (keycode >> 3)] & (1 << (keycode & 7))
+    ]
+
+
+def test_nkro_press_key():
+    device, keyboard = make_keyboard(nkro=True)
+    keyboard.press(Keycode.CONTROL, *SEVEN_KEYS)
+    report = device.report(-1)
+    assert len(report) == 29
+    assert report[0] == 0x01
+    assert nkro_keys(report) == sorted(SEVEN_KEYS)
+    keyboard.release_key(Keycode.A)
+    assert nkro_keys(device.report(-1)) == sorted(SEVEN_KEYS[1:])
+
+
+def test_nkro_send_reports():
+    device, keyboard = make_keyboard(nkro=True)
+    reports = bytes(
+        (0x02, 0, Keycode.A, Keycode.B, 0, 0, 0, 0)
+        + (0, 0, Keycode.C, 0, 0, 0, 0, 0)
+        + (0, 0, 0, 0, 0, 0, 0, 0)
+    )
+    keyboard.send_reports(reports)
+    sent = [bytes(report) for *_, report in device.reports()]
+    assert len(sent) == 3
+    assert sent[0][0] == 0x02
+    assert nkro_keys(sent[0]) == [Keycode.A, Keycode.B]
+    assert sent[1][0] == 0
+    assert nkro_keys(sent[1]) == [Keycode.C]
+    assert not any(sent[2])
+    # The keyboard state matches the last report.
+    assert not any(keyboard.report)
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import random
+
+import pytest
+
+from sample_layout import KeyboardLayoutSample, typed_text
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_base import KeyboardLayoutBase
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.keycode import Keycode
+from adafruit_hid.layout_translator import LayoutTranslator
+from adafruit_hid.recording_device import RecordingDevice
+
+TYPING_MODES = (
+    KeyboardLayoutBase.TYPING_SEQUENTIAL,
+    KeyboardLayoutBase.TYPING_MINIMAL,
+    KeyboardLayoutBase.TYPING_ROLLOVER,
+)
+
+
+def type_reports(layout_class, text, typing_mode):
+    device = RecordingDevice(usage_page=0x1, usage=0x06)
+    layout_class(Keyboard(device), typing_mode).write(text)
+    return [bytes(report) for *_, report in device.reports()]
+
+
+def translate(source, target, reports):
+    translator = LayoutTranslator(source, target)
+    output = []
+    for report in reports:
+        translator.translate(report, lambda report: output.append(bytes(report)))
+    return output
+
+
+@pytest.mark.parametrize("typing_mode", TYPING_MODES)
+def test_source_dead_keys(typing_mode):
+    text = "Hello, World! @€ â ê ^ ñ é è"
+    reports = type_reports(KeyboardLayoutSample, text, typing_mode)
+    assert typed_text(KeyboardLayoutSample, reports) == text
+    output = translate(KeyboardLayoutSample, KeyboardLayoutSample, reports)
+    assert typed_text(KeyboardLayoutSample, output) == text
+    # Characters missing from the target layout are dropped.
+    output = translate(KeyboardLayoutSample, KeyboardLayoutUS, reports)
+    assert typed_text(KeyboardLayoutUS, output) == "".join(
+        char for char in text if ord(char) < 128
+    )
+
+
+@pytest.mark.parametrize("typing_mode", TYPING_MODES)
+def test_target_dead_keys(typing_mode):
+    # ^ is typed with the dead key and a space, @ with altgr.
+    text = "a^b@c~ Q"
+    reports = type_reports(KeyboardLayoutUS, text, typing_mode)
+    output = translate(KeyboardLayoutUS, KeyboardLayoutSample, reports)
+    assert typed_text(KeyboardLayoutSample, output) == text
+
+
+def test_passes_through_shortcuts():
+    control_c = bytes((0x01, 0, Keycode.C, 0, 0, 0, 0, 0))
+    shift_right = bytes((0x02, 0, Keycode.RIGHT_ARROW, 0, 0, 0, 0, 0))
+    reports = [control_c, bytes(8), shift_right, bytes(8)]
+    assert translate(KeyboardLayoutSample, KeyboardLayoutUS, reports) == reports
+
+
+@pytest.mark.parametrize(
+    "source, target, text, typing_mode",
+    (
+        # @ and Q both become Q in the sample layout, in one report.
+        (KeyboardLayoutUS, KeyboardLayoutSample, "@Q", TYPING_MODES[2]),
+        # ^ and 6 both become 6 in the US layout, released and pressed in one report.
+        (KeyboardLayoutSample, KeyboardLayoutUS, "^6", TYPING_MODES[1]),
+    ),
+)
+def test_same_target_key(source, target, text, typing_mode):
+    reports = type_reports(source, text, typing_mode)
+    output = translate(source, target, reports)
+    assert typed_text(target, output) == text
+
+
+@pytest.mark.parametrize("typing_mode", TYPING_MODES)
+def test_random_round_trip(typing_mode):
+    chars = "abc6^@Qq€é è ñâ"
+    generator = random.Random(typing_mode)
+    for _ in range(50):
+        text = "".join(generator.choice(chars) for _ in range(8))
+        reports = type_reports(KeyboardLayoutSample, text, typing_mode)
+        output = translate(KeyboardLayoutSample, KeyboardLayoutSample, reports)
+        assert typed_text(KeyboardLayoutSample, output) == text
+        ascii_text = "".join(char for char in text if ord(char) < 128)
+        output = translate(KeyboardLayoutSample, KeyboardLayoutUS, reports)
+        assert typed_text(KeyboardLayoutUS, output) == ascii_text
+        reports = type_reports(KeyboardLayoutUS, ascii_text, typing_mode)
+        output = translate(KeyboardLayoutUS, KeyboardLayoutSample, reports)
+        assert typed_text(KeyboardLayoutSample, output) == ascii_text
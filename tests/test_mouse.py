@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid.mouse import Mouse
+from adafruit_hid.recording_device import RecordingDevice
+
+
+def make_mouse(**kwargs):
+    device = RecordingDevice(usage_page=0x1, usage=0x02)
+    return device, Mouse(device, **kwargs)
+
+
+def sent(device):
+    return [bytes(report).hex() for *_, report in device.reports()]
+
+
+def test_click_after_motion():
+    device, mouse = make_mouse()
+    mouse.accumulate(50, 0)
+    mouse.press(Mouse.LEFT_BUTTON)
+    mouse.accumulate(300, 0)
+    mouse.release(Mouse.LEFT_BUTTON)
+    assert sent(device) == [
+        "00320000",
+        "01000000",
+        "017f0000",
+        "017f0000",
+        "012e0000",
+        "00000000",
+    ]
+
+
+def test_accumulate_until_flush():
+    device, mouse = make_mouse()
+    mouse.accumulate(1.5, -2)
+    mouse.accumulate(1.0, -1, wheel=1)
+    assert not device.sent
+    mouse.flush()
+    assert sent(device) == ["0002fd01"]
+    # The half unit left over is sent with the next motion.
+    mouse.accumulate(0.5)
+    mouse.flush()
+    assert sent(device)[-1] == "00010000"
+    mouse.flush()
+    assert device.sent == 2
+
+
+def test_flush_interval(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("adafruit_hid.mouse.time.monotonic", lambda: now[0])
+    device, mouse = make_mouse(flush_interval=0.008)
+    mouse.accumulate(3)
+    mouse.accumulate(4)
+    assert not device.sent
+    now[0] = 0.008
+    mouse.accumulate(5)
+    assert sent(device) == ["000c0000"]
+
+
+def test_fractional_move():
+    device, mouse = make_mouse()
+    for _ in range(4):
+        mouse.move(x=0.5, y=-0.25)
+    assert sent(device) == ["00010000", "0001ff00"]
+
+
+def test_large_move_split():
+    device, mouse = make_mouse()
+    mouse.move(x=200, y=-130)
+    assert sent(device) == ["007f8100", "0049fd00"]
+
+
+def test_extended_report():
+    device, mouse = make_mouse(extended=True)
+    mouse.press(Mouse.BACK_BUTTON)
+    mouse.move(x=1000, y=-2, wheel=1, pan=-1)
+    assert sent(device) == ["08000000000000", "08e803feff01ff"]
+    mouse.move(x=40000)
+    assert sent(device)[-2:] == ["08ff7f00000000", "08411c00000000"]
+
+
+def test_pan_requires_extended():
+    _, mouse = make_mouse()
+    with pytest.raises(ValueError):
+        mouse.move(pan=1)
+    with pytest.raises(ValueError):
+        mouse.accumulate(pan=1)
@@ -0,0 +1,72 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import io
+
+import pytest
+
+from sample_layout import KeyboardLayoutSample
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keyboard_layout_base import KeyboardLayoutBase
+from adafruit_hid.keyboard_layout_us import KeyboardLayoutUS
+from adafruit_hid.packed_layout import PackedKeyboardLayout, pack_layout
+from adafruit_hid.recording_device import RecordingDevice
+
+TEXTS = (
+    (KeyboardLayoutUS, "Hello, World!\n\t~`@#"),
+    (KeyboardLayoutSample, "Hello @€ â ê ^ ñ é è 2 q"),
+)
+
+
+@pytest.mark.parametrize("layout_class, text", TEXTS)
+@pytest.mark.parametrize(
+    "typing_mode",
+    (
+        KeyboardLayoutBase.TYPING_SEQUENTIAL,
+        KeyboardLayoutBase.TYPING_MINIMAL,
+        KeyboardLayoutBase.TYPING_ROLLOVER,
+    ),
+)
+def test_round_trip(layout_class, text, typing_mode):
+    expected = RecordingDevice(usage_page=0x1, usage=0x06)
+    layout_class(Keyboard(expected), typing_mode).write(text)
+    device = RecordingDevice(usage_page=0x1, usage=0x06)
+    packed = io.BytesIO(pack_layout(layout_class))
+    PackedKeyboardLayout(Keyboard(device), packed, typing_mode).write(text)
+    assert [bytes(report) for *_, report in device.reports()] == [
+        bytes(report) for *_, report in expected.reports()
+    ]
+
+
+@pytest.mark.parametrize("layout_class, text", TEXTS)
+def test_same_keycodes(layout_class, text):
+    reference = layout_class(Keyboard(RecordingDevice()))
+    layout = PackedKeyboardLayout(
+        Keyboard(RecordingDevice()), pack_layout(layout_class)
+    )
+    assert layout.SHIFT_CODE == reference.SHIFT_CODE
+    assert layout.RIGHT_ALT_CODE == reference.RIGHT_ALT_CODE
+    for char in set(text) - {"^", "â", "ê", "ñ"}:
+        assert list(layout.keycodes(char)) == list(reference.keycodes(char))
+    with pytest.raises(ValueError):
+        layout.keycodes("\x00")
+
+
+def test_rejects_other_data():
+    packed = pack_layout(KeyboardLayoutUS)
+    with pytest.raises(ValueError):
+        PackedKeyboardLayout(Keyboard(RecordingDevice()), b"junk")
+    with pytest.raises(ValueError):
+        PackedKeyboardLayout(Keyboard(RecordingDevice()), packed[:-1])
+
+
+def test_rejects_astral_characters():
+    class KeyboardLayoutEmoji(
+        KeyboardLayoutUS
+    ):  # pylint: disable=too-few-public-methods
+        HIGHER_ASCII = {0x1F600: 0x04}
+
+    with pytest.raises(ValueError):
+        pack_layout(KeyboardLayoutEmoji)
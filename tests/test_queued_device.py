@@ -0,0 +1,49 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+from adafruit_hid.queued_device import QueuedDevice
+from adafruit_hid.recording_device import RecordingDevice
+
+
+def sent_reports(device):
+    return [(report_id, bytes(report)) for _, _, report_id, report in device.reports()]
+
+
+def test_drop_oldest():
+    device = RecordingDevice()
+    queued = QueuedDevice(device, slots=2, background=False)
+    for value in range(4):
+        queued.send_report(bytes((value,)))
+    assert queued.dropped == 2
+    queued.process()
+    assert sent_reports(device) == [(None, b"\x02"), (None, b"\x03")]
+
+
+def test_coalesce_same_report_id():
+    device = RecordingDevice()
+    queued = QueuedDevice(
+        device, slots=2, policy=QueuedDevice.COALESCE, background=False
+    )
+    queued.send_report(b"\x01", 1)
+    queued.send_report(b"\x02", 2)
+    queued.send_report(b"\x03", 2)
+    assert queued.coalesced == 1
+    assert queued.dropped == 0
+    queued.process()
+    assert sent_reports(device) == [(1, b"\x01"), (2, b"\x03")]
+
+
+def test_coalesce_other_report_id():
+    device = RecordingDevice()
+    queued = QueuedDevice(
+        device, slots=2, policy=QueuedDevice.COALESCE, background=False
+    )
+    queued.send_report(b"\x01", 1)
+    queued.send_report(b"\x02", 2)
+    # The newest report is for another report ID: it is kept, the oldest is dropped.
+    queued.send_report(b"\x03", 1)
+    assert queued.coalesced == 0
+    assert queued.dropped == 1
+    queued.process()
+    assert sent_reports(device) == [(2, b"\x02"), (1, b"\x03")]
@@ -0,0 +1,135 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import pytest
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.keycode import Keycode
+from adafruit_hid.queued_device import QueuedDevice
+from adafruit_hid.recording_device import RecordingDevice
+
+
+class Clock:
+    """Clock returning controlled times, in nanoseconds."""
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+def test_records_report_ids():
+    device = RecordingDevice()
+    device.send_report(b"\x01\x02", 3)
+    device.send_report(b"\x04")
+    assert device.sent == 2
+    assert device.recorded == 2
+    assert bytes(device.report(0)) == b"\x01\x02"
+    assert bytes(device.report(-1)) == b"\x04"
+    reports = [
+        (report_id, bytes(report)) for _, _, report_id, report in device.reports()
+    ]
+    assert reports == [(3, b"\x01\x02"), (None, b"\x04")]
+
+
+def test_keeps_the_newest_reports():
+    device = RecordingDevice(capacity=3)
+    for value in range(5):
+        device.send_report(bytes((value,)))
+    assert device.sent == 5
+    assert device.recorded == 3
+    assert [bytes(report) for *_, report in device.reports()] == [
+        b"\x02",
+        b"\x03",
+        b"\x04",
+    ]
+    with pytest.raises(IndexError):
+        device.report(3)
+
+
+def test_clear():
+    device = RecordingDevice()
+    device.send_report(b"\x01")
+    device.clear()
+    assert device.sent == 0
+    assert not list(device.reports())
+
+
+def test_rejects_reports_too_long():
+    device = RecordingDevice(report_length=8)
+    with pytest.raises(ValueError):
+        device.send_report(bytes(9))
+
+
+def test_poll_interval():
+    clock = Clock()
+    device = RecordingDevice(poll_interval=0.001, clock=clock)
+    for _ in range(3):
+        device.send_report(b"\x00")
+    assert [(sent, delivered) for sent, delivered, _, _ in device.reports()] == [
+        (0, 0),
+        (0, 1_000_000),
+        (0, 2_000_000),
+    ]
+
+
+def test_stall_count():
+    device = RecordingDevice()
+    keyboard = Keyboard(device)
+    device.stall(2)
+    for _ in range(2):
+        with pytest.raises(OSError):
+            keyboard.press(Keycode.A)
+    keyboard.press(Keycode.A)
+    assert device.failed == 2
+    assert device.sent == 1
+
+
+def test_stall_duration():
+    clock = Clock()
+    device = RecordingDevice(clock=clock)
+    device.stall(duration=1)
+    with pytest.raises(OSError):
+        device.send_report(b"\x00")
+    clock.now = 1_000_000_000
+    device.send_report(b"\x00")
+    assert device.sent == 1
+
+
+def test_queued_device_retries():
+    device = RecordingDevice()
+    queued = QueuedDevice(device, background=False)
+    device.stall(3)
+    queued.send_report(b"\x01")
+    for _ in range(4):
+        queued.process()
+    assert device.failed == 3
+    assert bytes(device.report(0)) == b"\x01"
+
+
+def test_receive_report():
+    device = RecordingDevice()
+    keyboard = Keyboard(device)
+    device.receive_report(bytes((Keyboard.LED_CAPS_LOCK,)))
+    assert keyboard.led_on(Keyboard.LED_CAPS_LOCK)
+    assert device.get_last_received_report() is None
+
+
+def test_replay_one_report_per_call():
+    device = RecordingDevice()
+    device.replay([(None, b"\x02"), (None, b"\x00")])
+    assert device.get_last_received_report() == b"\x02"
+    assert device.get_last_received_report() == b"\x00"
+    assert device.get_last_received_report() is None
+
+
+def test_replay_with_interval():
+    clock = Clock()
+    device = RecordingDevice(clock=clock)
+    device.replay([(None, b"\x01"), (None, b"\x04")], interval=1)
+    assert device.get_last_received_report() == b"\x01"
+    assert device.get_last_received_report() is None
+    clock.now = 5_000_000_000
+    assert device.get_last_received_report() == b"\x04"
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2026 quaxalber
+#
+# SPDX-License-Identifier: MIT
+
+import io
+
+import pytest
+
+from sample_layout import KeyboardLayoutSample
+
+from adafruit_hid.keyboard import Keyboard
+from adafruit_hid.recording_device import RecordingDevice
+
+TEXT = "Hello @€ â ê ^ ñ é è\n"
+
+
+def make_layout():
+    device = RecordingDevice(usage_page=0x1, usage=0x06)
+    return device, KeyboardLayoutSample(Keyboard(device))
+
+
+def sent_reports(device):
+    return [bytes(report) for *_, report in device.reports()]
+
+
+def written_reports(text):
+    device, layout = make_layout()
+    layout.write(text)
+    return sent_reports(device)
+
+
+@pytest.mark.parametrize("chunk_size", (1, 2, 3, 5))
+def test_split_characters(chunk_size):
+    # Every multi-byte character is cut somewhere by one of the chunk sizes.
+    device, layout = make_layout()
+    layout.write_stream(io.BytesIO(TEXT.encode("utf-8")), chunk_size=chunk_size)
+    assert sent_reports(device) == written_reports(TEXT)
+
+
+def test_iterable_of_bytes():
+    data = TEXT.encode("utf-8")
+    device, layout = make_layout()
+    layout.write_stream(data[i : i + 1] for i in range(len(data)))
+    assert sent_reports(device) == written_reports(TEXT)
+
+
+def test_text_stream():
+    device, layout = make_layout()
+    layout.write_stream(io.StringIO(TEXT), chunk_size=4)
+    assert sent_reports(device) == written_reports(TEXT)
+
+
+def test_incomplete_last_character():
+    _, layout = make_layout()
+    with pytest.raises(ValueError):
+        layout.write_stream([b"a", "€".encode("utf-8")[:2]])
+
+
+@pytest.mark.parametrize("data", (b"a\xff", b"a\xf8\x80", b"a\x80"))
+def test_invalid_utf8(data):
+    device, layout = make_layout()
+    with pytest.raises(ValueError):
+        layout.write_stream([data, b"b"])
+    # The chunk is rejected as a whole, rather than held back as a cut character.
+    assert not device.sent